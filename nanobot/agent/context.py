@@ -184,7 +184,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         result: str
     ) -> list[dict[str, Any]]:
         """
-        Add a tool result to the message list.
+        Add a tool result to the message list (in place).
         
         Args:
             messages: Current message list.
@@ -193,7 +193,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             result: Tool execution result.
         
         Returns:
-            Updated message list.
+            The same message list, for chaining.
         """
         messages.append({
             "role": "tool",
@@ -210,7 +210,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
         tool_calls: list[dict[str, Any]] | None = None
     ) -> list[dict[str, Any]]:
         """
-        Add an assistant message to the message list.
+        Add an assistant message to the message list (in place).
         
         Args:
             messages: Current message list.
@@ -218,7 +218,7 @@ When remembering something, write to {workspace_path}/memory/MEMORY.md"""
             tool_calls: Optional tool calls.
         
         Returns:
-            Updated message list.
+            The same message list, for chaining.
         """
         msg: dict[str, Any] = {"role": "assistant", "content": content or ""}
         
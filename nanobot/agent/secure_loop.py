@@ -5,15 +5,21 @@ for policy-controlled tool execution with the Omega taxonomy.
 """
 
 import asyncio
+import functools
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
+
 from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
-from nanobot.providers.base import LLMProvider
+from nanobot.providers.base import LLMProvider, ToolCallRequest
 from nanobot.agent.context import ContextBuilder
 from nanobot.agent.tools.secure_registry import SecureToolRegistry, DEFAULT_OMEGA_MAPPINGS
 from nanobot.agent.tools.filesystem import ReadFileTool, WriteFileTool, EditFileTool, ListDirTool
@@ -32,6 +38,18 @@ from nanobot.fitsec import (
 )
 
 
+def _dumps_args(arguments: dict[str, Any]) -> str:
+    """Serialize tool call arguments once for both the LLM history and logs."""
+    if orjson is not None:
+        return orjson.dumps(arguments).decode()
+    return json.dumps(arguments, ensure_ascii=False)
+
+
+def _preview(text: str, limit: int) -> str:
+    """Truncate text for log output."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
 class SecureAgentLoop:
     """
     Secure agent loop with FIT-Sec governance.
@@ -56,6 +74,8 @@ class SecureAgentLoop:
         restrict_to_workspace: bool = False,
         strict_mode: bool = True,
         audit_path: Path | None = None,
+        max_parallel_subagents: int = 4,
+        max_concurrent_messages: int = 8,
     ):
         from nanobot.config.schema import ExecToolConfig
         from nanobot.cron.service import CronService
@@ -88,10 +108,21 @@ class SecureAgentLoop:
             brave_api_key=brave_api_key,
             exec_config=self.exec_config,
             restrict_to_workspace=restrict_to_workspace,
+            max_concurrent=max_parallel_subagents,
         )
 
-        self._running = False
+        self._stop_event = asyncio.Event()
+        # Messages for different sessions run concurrently (bounded); messages
+        # within one session are serialized in arrival order.
+        self._message_slots = asyncio.Semaphore(max_concurrent_messages)
+        # Per-session locks, dropped once no message of the session holds or
+        # waits on them (_session_users counts those messages)
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self._session_users: dict[str, int] = {}
+        self._dispatch_tasks: set[asyncio.Task] = set()
         self._register_default_tools()
+        self._bind_chat()
+        self._context_setters = self._collect_context_setters()
 
         logger.info("SecureAgentLoop initialized with FIT-Sec governance")
 
@@ -154,18 +185,71 @@ class SecureAgentLoop:
 
         logger.info(f"Registered {len(self.tools)} tools with FIT-Sec")
 
+    def _bind_chat(self) -> None:
+        """
+        Pre-bind provider.chat with the current tool definitions and model.
+
+        Call again after registering or unregistering tools on self.tools.
+        """
+        self._tool_defs = self.tools.get_definitions()
+        self._chat = functools.partial(
+            self.provider.chat, tools=self._tool_defs, model=self.model
+        )
+
+    def _collect_context_setters(self) -> list[Callable[[str, str], None]]:
+        """Resolve the set_context hooks of context-aware tools once."""
+        setters: list[Callable[[str, str], None]] = []
+        for name, tool_type in (("message", MessageTool), ("spawn", SpawnTool), ("cron", CronTool)):
+            tool = self.tools.get(name)
+            if isinstance(tool, tool_type):
+                setters.append(tool.set_context)
+        return setters
+
     async def run(self) -> None:
-        """Run the secure agent loop, processing messages from the bus."""
-        self._running = True
-        logger.info("SecureAgentLoop started")
+        """
+        Run the secure agent loop, processing messages from the bus.
 
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(
-                    self.bus.consume_inbound(),
-                    timeout=1.0
-                )
+        After stop(), returns once the messages already being processed have
+        finished and their audit records have been written.
+        """
+        self._stop_event.clear()
+        logger.info("SecureAgentLoop started")
+        logger.opt(lazy=True).debug(
+            "Event loop: {}", lambda: type(asyncio.get_running_loop()).__module__,
+        )
 
+        # Sleep on the bus until a message arrives or stop() is called,
+        # instead of waking up every second to poll.
+        stop_wait = asyncio.create_task(self._stop_event.wait())
+        try:
+            while not self._stop_event.is_set():
+                get_task = asyncio.create_task(self.bus.consume_inbound())
+                await asyncio.wait({get_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                if not get_task.done():
+                    get_task.cancel()
+                    break
+
+                task = asyncio.create_task(self._dispatch(get_task.result()))
+                self._dispatch_tasks.add(task)
+                task.add_done_callback(self._dispatch_tasks.discard)
+        finally:
+            stop_wait.cancel()
+            if self._dispatch_tasks:
+                await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+            self.tools.flush_audit()
+
+    async def _dispatch(self, msg: InboundMessage) -> None:
+        """Process one message under its session lock and the global concurrency limit."""
+        key = self._lock_key(msg)
+        lock = self._session_locks.get(key)
+        if lock is None:
+            lock = self._session_locks[key] = asyncio.Lock()
+            self._session_users[key] = 0
+        self._session_users[key] += 1
+        try:
+            # Take the session lock first so a backlog in one session doesn't
+            # hold slots that other sessions could use.
+            async with lock, self._message_slots:
                 try:
                     response = await self._process_message(msg)
                     if response:
@@ -177,12 +261,27 @@ class SecureAgentLoop:
                         chat_id=msg.chat_id,
                         content=f"Sorry, I encountered an error: {str(e)}"
                     ))
-            except asyncio.TimeoutError:
-                continue
+        finally:
+            self._session_users[key] -= 1
+            if not self._session_users[key]:
+                del self._session_users[key], self._session_locks[key]
+
+    @staticmethod
+    def _lock_key(msg: InboundMessage) -> str:
+        """Session key a message writes to (system messages target their origin)."""
+        if msg.channel == "system":
+            return msg.chat_id if ":" in msg.chat_id else f"cli:{msg.chat_id}"
+        return msg.session_key
 
     def stop(self) -> None:
-        """Stop the agent loop."""
-        self._running = False
+        """
+        Stop the agent loop.
+
+        In-flight messages are not cancelled: run() waits for them and then
+        flushes the audit log before returning.
+        """
+        self._stop_event.set()
+        self.tools.flush_audit()
         logger.info("SecureAgentLoop stopping")
 
     async def _process_message(self, msg: InboundMessage) -> OutboundMessage | None:
@@ -190,23 +289,16 @@ class SecureAgentLoop:
         if msg.channel == "system":
             return await self._process_system_message(msg)
 
-        preview = msg.content[:80] + "..." if len(msg.content) > 80 else msg.content
-        logger.info(f"Processing message from {msg.channel}:{msg.sender_id}: {preview}")
+        logger.opt(lazy=True).info(
+            "Processing message from {}:{}: {}",
+            lambda: msg.channel, lambda: msg.sender_id, lambda: _preview(msg.content, 80),
+        )
 
         session = self.sessions.get_or_create(msg.session_key)
 
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(msg.channel, msg.chat_id)
-
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(msg.channel, msg.chat_id)
-
-        cron_tool = self.tools.get("cron")
-        if isinstance(cron_tool, CronTool):
-            cron_tool.set_context(msg.channel, msg.chat_id)
+        for set_context in self._context_setters:
+            set_context(msg.channel, msg.chat_id)
 
         messages = self.context.build_messages(
             history=session.get_history(),
@@ -216,64 +308,15 @@ class SecureAgentLoop:
             chat_id=msg.chat_id,
         )
 
-        iteration = 0
-        final_content = None
-
-        while iteration < self.max_iterations:
-            iteration += 1
-
-            response = await self.provider.chat(
-                messages=messages,
-                tools=self.tools.get_definitions(),
-                model=self.model
-            )
-
-            if response.has_tool_calls:
-                tool_call_dicts = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)
-                        }
-                    }
-                    for tc in response.tool_calls
-                ]
-                messages = self.context.add_assistant_message(
-                    messages, response.content, tool_call_dicts
-                )
-
-                # Execute tools with FIT-Sec checks
-                for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
-
-                    try:
-                        # This now goes through SecureToolRegistry with FIT-Sec
-                        result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                    except PolicyDeniedError as e:
-                        result = f"[POLICY DENIED] {e}"
-                        logger.warning(f"Policy denied: {tool_call.name} - {e}")
-                    except EmptinessActiveError as e:
-                        result = f"[EMPTINESS BLOCKED] {e}"
-                        logger.warning(f"Emptiness blocked: {tool_call.name} - {e}")
-                    except GateFailedError as e:
-                        result = f"[GATE FAILED] {e}"
-                        logger.warning(f"Gate failed: {tool_call.name} - {e}")
-
-                    messages = self.context.add_tool_result(
-                        messages, tool_call.id, tool_call.name, result
-                    )
-            else:
-                final_content = response.content
-                break
+        final_content = await self._run_agent_loop(messages)
 
         if final_content is None:
             final_content = "I've completed processing but have no response to give."
 
-        preview = final_content[:120] + "..." if len(final_content) > 120 else final_content
-        logger.info(f"Response to {msg.channel}:{msg.sender_id}: {preview}")
+        logger.opt(lazy=True).info(
+            "Response to {}:{}: {}",
+            lambda: msg.channel, lambda: msg.sender_id, lambda: _preview(final_content, 120),
+        )
 
         session.add_message("user", msg.content)
         session.add_message("assistant", final_content)
@@ -301,17 +344,8 @@ class SecureAgentLoop:
         session = self.sessions.get_or_create(session_key)
 
         # Update tool contexts
-        message_tool = self.tools.get("message")
-        if isinstance(message_tool, MessageTool):
-            message_tool.set_context(origin_channel, origin_chat_id)
-
-        spawn_tool = self.tools.get("spawn")
-        if isinstance(spawn_tool, SpawnTool):
-            spawn_tool.set_context(origin_channel, origin_chat_id)
-
-        cron_tool = self.tools.get("cron")
-        if isinstance(cron_tool, CronTool):
-            cron_tool.set_context(origin_channel, origin_chat_id)
+        for set_context in self._context_setters:
+            set_context(origin_channel, origin_chat_id)
 
         messages = self.context.build_messages(
             history=session.get_history(),
@@ -320,50 +354,7 @@ class SecureAgentLoop:
             chat_id=origin_chat_id,
         )
 
-        iteration = 0
-        final_content = None
-
-        while iteration < self.max_iterations:
-            iteration += 1
-
-            response = await self.provider.chat(
-                messages=messages,
-                tools=self.tools.get_definitions(),
-                model=self.model
-            )
-
-            if response.has_tool_calls:
-                tool_call_dicts = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.name,
-                            "arguments": json.dumps(tc.arguments)
-                        }
-                    }
-                    for tc in response.tool_calls
-                ]
-                messages = self.context.add_assistant_message(
-                    messages, response.content, tool_call_dicts
-                )
-
-                for tool_call in response.tool_calls:
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
-                    logger.info(f"Tool call: {tool_call.name}({args_str[:200]})")
-
-                    try:
-                        result = await self.tools.execute(tool_call.name, tool_call.arguments)
-                    except (PolicyDeniedError, EmptinessActiveError, GateFailedError) as e:
-                        result = f"[BLOCKED] {e}"
-                        logger.warning(f"Tool blocked: {tool_call.name} - {e}")
-
-                    messages = self.context.add_tool_result(
-                        messages, tool_call.id, tool_call.name, result
-                    )
-            else:
-                final_content = response.content
-                break
+        final_content = await self._run_agent_loop(messages)
 
         if final_content is None:
             final_content = "Background task completed."
@@ -378,6 +369,95 @@ class SecureAgentLoop:
             content=final_content
         )
 
+    async def _run_agent_loop(self, messages: list[dict[str, Any]]) -> str | None:
+        """
+        Alternate LLM calls and tool execution until the model answers.
+
+        Returns the final content as soon as a response has no tool calls,
+        or None if max_iterations is exhausted.
+        """
+        for _ in range(self.max_iterations):
+            response = await self._chat(messages=messages)
+
+            if not response.has_tool_calls:
+                return response.content
+
+            # Providers that take argument dicts skip the encode/decode round trip
+            structured = self.provider.accepts_structured_tool_args
+            tool_call_dicts = [
+                {
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.name,
+                        "arguments": tc.arguments if structured else _dumps_args(tc.arguments)
+                    }
+                }
+                for tc in response.tool_calls
+            ]
+            self.context.add_assistant_message(
+                messages, response.content, tool_call_dicts
+            )
+
+            # Execute tools with FIT-Sec checks
+            results = await self._execute_tool_calls(response.tool_calls)
+            for tool_call, result in results:
+                self.context.add_tool_result(
+                    messages, tool_call.id, tool_call.name, result
+                )
+
+        return None
+
+    async def _execute_tool_calls(
+        self, tool_calls: list[ToolCallRequest]
+    ) -> list[tuple[ToolCallRequest, str]]:
+        """
+        Execute the tool calls of one LLM response, preserving their order.
+
+        Runs of consecutive O0 (read-only) calls are gathered concurrently.
+        O1/O2 calls have side effects, so each one waits for everything
+        before it and runs alone, keeping read-after-write order intact.
+        """
+        results: list[tuple[ToolCallRequest, str]] = []
+        pending: list[ToolCallRequest] = []
+
+        for tool_call in tool_calls:
+            if self.tools.get_omega_level(tool_call.name) is OmegaLevel.OMEGA_0:
+                pending.append(tool_call)
+                continue
+            if pending:
+                results.extend(await asyncio.gather(*map(self._safe_execute, pending)))
+                pending = []
+            results.append(await self._safe_execute(tool_call))
+
+        if pending:
+            results.extend(await asyncio.gather(*map(self._safe_execute, pending)))
+
+        return results
+
+    async def _safe_execute(self, tool_call: ToolCallRequest) -> tuple[ToolCallRequest, str]:
+        """Execute one tool call, mapping FIT-Sec denials to tool results."""
+        # Durable record of the call (with full arguments) lives in the audit log
+        logger.opt(lazy=True).debug(
+            "Tool call: {}({})",
+            lambda: tool_call.name, lambda: _dumps_args(tool_call.arguments)[:200],
+        )
+
+        try:
+            # This now goes through SecureToolRegistry with FIT-Sec
+            result = await self.tools.execute(tool_call.name, tool_call.arguments)
+        except PolicyDeniedError as e:
+            result = f"[POLICY DENIED] {e}"
+            logger.warning(f"Policy denied: {tool_call.name} - {e}")
+        except EmptinessActiveError as e:
+            result = f"[EMPTINESS BLOCKED] {e}"
+            logger.warning(f"Emptiness blocked: {tool_call.name} - {e}")
+        except GateFailedError as e:
+            result = f"[GATE FAILED] {e}"
+            logger.warning(f"Gate failed: {tool_call.name} - {e}")
+
+        return tool_call, result
+
     async def process_direct(
         self,
         content: str,
@@ -394,6 +474,7 @@ class SecureAgentLoop:
         )
 
         response = await self._process_message(msg)
+        self.tools.flush_audit()
         return response.content if response else ""
 
     # FIT-Sec control methods
@@ -425,4 +506,5 @@ class SecureAgentLoop:
 
     def get_audit_summary(self) -> dict[str, Any]:
         """Get audit summary from FIT-Sec runtime."""
+        self.tools.flush_audit()
         return self.tools.runtime.audit.get_summary()
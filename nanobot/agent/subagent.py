@@ -35,6 +35,7 @@ class SubagentManager:
         brave_api_key: str | None = None,
         exec_config: "ExecToolConfig | None" = None,
         restrict_to_workspace: bool = False,
+        max_concurrent: int = 4,
     ):
         from nanobot.config.schema import ExecToolConfig
         self.provider = provider
@@ -45,6 +46,7 @@ class SubagentManager:
         self.exec_config = exec_config or ExecToolConfig()
         self.restrict_to_workspace = restrict_to_workspace
         self._running_tasks: dict[str, asyncio.Task[None]] = {}
+        self._slots = asyncio.Semaphore(max_concurrent)
     
     async def spawn(
         self,
@@ -75,7 +77,7 @@ class SubagentManager:
         
         # Create background task
         bg_task = asyncio.create_task(
-            self._run_subagent(task_id, task, display_label, origin)
+            self._run_limited(task_id, task, display_label, origin)
         )
         self._running_tasks[task_id] = bg_task
         
@@ -85,6 +87,17 @@ class SubagentManager:
         logger.info(f"Spawned subagent [{task_id}]: {display_label}")
         return f"Subagent [{display_label}] started (id: {task_id}). I'll notify you when it completes."
     
+    async def _run_limited(
+        self,
+        task_id: str,
+        task: str,
+        label: str,
+        origin: dict[str, str],
+    ) -> None:
+        """Run a subagent once one of the max_concurrent slots is free."""
+        async with self._slots:
+            await self._run_subagent(task_id, task, label, origin)
+    
     async def _run_subagent(
         self,
         task_id: str,
@@ -1,11 +1,15 @@
 """Cron tool for scheduling reminders and tasks."""
 
+from contextvars import ContextVar
 from typing import Any
 
 from nanobot.agent.tools.base import Tool
 from nanobot.cron.service import CronService
 from nanobot.cron.types import CronSchedule
 
+# Per-task (channel, chat_id), so concurrently processed sessions don't clobber each other
+_context: ContextVar[tuple[str, str] | None] = ContextVar("cron_tool_context", default=None)
+
 
 class CronTool(Tool):
     """Tool to schedule reminders and recurring tasks."""
@@ -16,9 +20,8 @@ class CronTool(Tool):
         self._chat_id = ""
     
     def set_context(self, channel: str, chat_id: str) -> None:
-        """Set the current session context for delivery."""
-        self._channel = channel
-        self._chat_id = chat_id
+        """Set the current session context for delivery (scoped to the running task)."""
+        _context.set((channel, chat_id))
     
     @property
     def name(self) -> str:
@@ -78,7 +81,8 @@ class CronTool(Tool):
     def _add_job(self, message: str, every_seconds: int | None, cron_expr: str | None) -> str:
         if not message:
             return "Error: message is required for add"
-        if not self._channel or not self._chat_id:
+        channel, chat_id = _context.get() or (self._channel, self._chat_id)
+        if not channel or not chat_id:
             return "Error: no session context (channel/chat_id)"
         
         # Build schedule
@@ -94,8 +98,8 @@ class CronTool(Tool):
             schedule=schedule,
             message=message,
             deliver=True,
-            channel=self._channel,
-            to=self._chat_id,
+            channel=channel,
+            to=chat_id,
         )
         return f"Created job '{job.name}' (id: {job.id})"
     
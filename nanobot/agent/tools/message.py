@@ -1,10 +1,14 @@
 """Message tool for sending messages to users."""
 
+from contextvars import ContextVar
 from typing import Any, Callable, Awaitable
 
 from nanobot.agent.tools.base import Tool
 from nanobot.bus.events import OutboundMessage
 
+# Per-task (channel, chat_id), so concurrently processed sessions don't clobber each other
+_context: ContextVar[tuple[str, str] | None] = ContextVar("message_tool_context", default=None)
+
 
 class MessageTool(Tool):
     """Tool to send messages to users on chat channels."""
@@ -20,9 +24,8 @@ class MessageTool(Tool):
         self._default_chat_id = default_chat_id
     
     def set_context(self, channel: str, chat_id: str) -> None:
-        """Set the current message context."""
-        self._default_channel = channel
-        self._default_chat_id = chat_id
+        """Set the current message context (scoped to the running task)."""
+        _context.set((channel, chat_id))
     
     def set_send_callback(self, callback: Callable[[OutboundMessage], Awaitable[None]]) -> None:
         """Set the callback for sending messages."""
@@ -64,8 +67,11 @@ class MessageTool(Tool):
         chat_id: str | None = None,
         **kwargs: Any
     ) -> str:
-        channel = channel or self._default_channel
-        chat_id = chat_id or self._default_chat_id
+        default_channel, default_chat_id = _context.get() or (
+            self._default_channel, self._default_chat_id
+        )
+        channel = channel or default_channel
+        chat_id = chat_id or default_chat_id
         
         if not channel or not chat_id:
             return "Error: No target channel/chat specified"
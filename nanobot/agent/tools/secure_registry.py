@@ -4,8 +4,13 @@ This module wraps the standard ToolRegistry with FIT-Sec runtime checks,
 implementing the Omega taxonomy, Monitorability Gate, and Emptiness Window.
 """
 
+import asyncio
+import sys
+import time
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any
+
+from loguru import logger
 
 from nanobot.agent.tools.base import Tool
 from nanobot.agent.tools.registry import ToolRegistry
@@ -23,6 +28,8 @@ from nanobot.fitsec import (
     GateFailedError,
     ToolNotRegisteredError,
 )
+from nanobot.fitsec.policy import OMEGA0_ALLOW_RATIONALE
+from nanobot.fitsec.runtime import GATED_OMEGA_LEVELS
 
 
 # Default Omega level mappings for nanoBot tools
@@ -44,6 +51,11 @@ DEFAULT_OMEGA_MAPPINGS: dict[str, OmegaLevel] = {
     "cron": OmegaLevel.OMEGA_2,
 }
 
+# Audit records are handed to a background task and written in batches
+AUDIT_BATCH_SIZE = 64
+AUDIT_MAX_PENDING = 1024
+AUDIT_FLUSH_INTERVAL = 0.05  # seconds
+
 
 class SecureToolRegistry:
     """
@@ -76,7 +88,14 @@ class SecureToolRegistry:
         )
         self._omega_mappings = {**DEFAULT_OMEGA_MAPPINGS, **(omega_mappings or {})}
         self._workspace = workspace
-        self._tool_executors: dict[str, Callable] = {}
+        self._manifests: dict[str, ToolManifest] = {}
+        self._fast: dict[str, ToolManifest] = {}  # O0 tools that skip gate/policy checks
+        self._definitions_cache: list[dict[str, Any]] | None = None
+        self._audit_buffer: list[dict[str, Any]] = []
+        self._audit_pending = asyncio.Event()
+        self._audit_full = asyncio.Event()
+        self._audit_task: asyncio.Task[None] | None = None
+        self._audit_error: Exception | None = None  # drain failure, raised on the next call
 
     def register(self, tool: Tool, omega_level: OmegaLevel | None = None) -> None:
         """
@@ -86,41 +105,45 @@ class SecureToolRegistry:
             tool: The nanoBot tool to register.
             omega_level: Override Omega level (uses default mapping if None).
         """
+        # Interned names make the per-call dict lookups pointer comparisons
+        name = sys.intern(tool.name)
+
         # Register with nanoBot registry
         self._registry.register(tool)
+        self._definitions_cache = None
 
         # Determine Omega level
-        level = omega_level or self._omega_mappings.get(tool.name, OmegaLevel.OMEGA_1)
+        level = (
+            omega_level if omega_level is not None
+            else self._omega_mappings.get(name, OmegaLevel.OMEGA_1)
+        )
 
         # Build manifest for FIT-Sec
         manifest = ToolManifest(
-            tool_id=tool.name,
+            tool_id=name,
             omega_level=level,
             description=tool.description,
             requires_approval=(level == OmegaLevel.OMEGA_2),
         )
 
-        # Create async executor wrapper
-        async def make_executor(t: Tool):
-            async def executor(action: str, args: dict[str, Any]) -> str:
-                return await t.execute(**args)
-            return executor
-
-        # Store executor for later use
-        self._tool_executors[tool.name] = tool.execute
-
         # Register with FIT-Sec runtime (sync wrapper for manifest only)
+        self._manifests[name] = manifest
+        if level is OmegaLevel.OMEGA_0:
+            self._fast[name] = manifest
+        else:
+            self._fast.pop(name, None)
         self._runtime.register_tool(
             manifest,
-            executor=lambda action, args, name=tool.name: f"[ASYNC:{name}]",
+            executor=lambda action, args, name=name: f"[ASYNC:{name}]",
         )
 
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         self._registry.unregister(name)
+        self._definitions_cache = None
+        self._fast.pop(name, None)
         # Note: FitSecRuntime registry doesn't support unregistration
         # The manifest remains for audit purposes
-        self._tool_executors.pop(name, None)
 
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -130,9 +153,21 @@ class SecureToolRegistry:
         """Check if a tool is registered."""
         return self._registry.has(name)
 
+    def get_omega_level(self, name: str) -> OmegaLevel | None:
+        """Get the Omega level a tool was registered with (None if unknown)."""
+        manifest = self._manifests.get(name)
+        return manifest.omega_level if manifest else None
+
     def get_definitions(self) -> list[dict[str, Any]]:
-        """Get all tool definitions in OpenAI format."""
-        return self._registry.get_definitions()
+        """
+        Get all tool definitions in OpenAI format.
+
+        The list is built once and reused until a tool is registered or
+        unregistered; callers must not mutate it.
+        """
+        if self._definitions_cache is None:
+            self._definitions_cache = self._registry.get_definitions()
+        return self._definitions_cache
 
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """
@@ -161,7 +196,7 @@ class SecureToolRegistry:
             error: str,
             metrics_snapshot: GateMetrics | None = None,
         ) -> None:
-            self._runtime.audit.log(
+            self._queue_audit(
                 tool_call=call,
                 manifest=manifest,
                 policy_decision=PolicyDecision(
@@ -170,25 +205,48 @@ class SecureToolRegistry:
                     gate_status=gate_status,
                     rationale=rationale,
                     metrics_snapshot=metrics_snapshot,
+                    timestamp=now,
                 ),
                 executed=False,
                 error=error,
+                timestamp=now,
             )
 
-        # Build ToolCall for FIT-Sec
+        name = sys.intern(name)
+
+        # One clock read stamps the call, its decision and its audit record
+        now = time.time()
         call = ToolCall(
             tool_id=name,
             action="execute",
             args=params,
+            timestamp=now,
         )
 
-        # Get manifest from registry
-        manifest = self._runtime.registry.get_manifest(name)
+        # Fast path: O0 tools are allowed in every mode unless blocklisted
+        fast_manifest = self._fast.get(name)
+        if fast_manifest is not None and not self._runtime.policy.is_blocked(name):
+            return await self._execute_and_audit(
+                call,
+                fast_manifest,
+                PolicyDecision(
+                    decision=Decision.ALLOW,
+                    omega_level=OmegaLevel.OMEGA_0,
+                    gate_status=GateStatus.PASS,
+                    rationale=OMEGA0_ALLOW_RATIONALE,
+                    timestamp=now,
+                ),
+            )
+
+        # Manifests are cached locally at registration
+        manifest = self._manifests.get(name)
+        runtime = self._runtime
 
         # Check Emptiness Window first
-        if self._runtime.emptiness.is_active:
-            if manifest and not self._runtime.emptiness.check_allowed(manifest.omega_level):
-                self._runtime.emptiness.record_blocked_call(call)
+        emptiness = runtime.emptiness
+        if emptiness.is_active:
+            if manifest and manifest.omega_level not in emptiness.allowed_omegas:
+                emptiness.record_blocked_call(call)
                 audit_deny(
                     rationale="Blocked by Emptiness Window",
                     omega_level=manifest.omega_level,
@@ -201,21 +259,23 @@ class SecureToolRegistry:
 
         # Check Monitorability Gate for O1/O2 tools
         gate_status = GateStatus.PASS
-        if manifest and manifest.omega_level in (OmegaLevel.OMEGA_1, OmegaLevel.OMEGA_2):
-            gate_status = self._runtime.gate.check()
-            if gate_status not in (GateStatus.PASS, GateStatus.UNKNOWN) and self._runtime.strict_mode:
-                metrics = self._runtime.gate.get_metrics()
+        if manifest and manifest.omega_level in GATED_OMEGA_LEVELS:
+            gate_check = runtime.gate.check_detailed()
+            gate_status = gate_check.status
+            if gate_status not in (GateStatus.PASS, GateStatus.UNKNOWN) and runtime.strict_mode:
                 audit_deny(
                     rationale=f"Monitorability Gate failed: {gate_status.name}",
                     omega_level=manifest.omega_level,
                     gate_status=gate_status,
-                    metrics_snapshot=metrics,
+                    metrics_snapshot=gate_check.metrics,
                     error="GateFailedError",
                 )
-                raise GateFailedError(self._runtime.gate.get_failure_reason() or gate_status.name)
+                raise GateFailedError(
+                    runtime.gate.format_failure_reason(gate_check) or gate_status.name
+                )
 
         # Evaluate policy
-        decision = self._runtime.policy.evaluate(call, manifest, gate_status)
+        decision = runtime.policy.evaluate(call, manifest, gate_status, timestamp=now)
 
         # Policy check
         if decision.decision == Decision.DENY:
@@ -226,37 +286,119 @@ class SecureToolRegistry:
                 metrics_snapshot=decision.metrics_snapshot,
                 error="PolicyDeniedError",
             )
-            raise PolicyDeniedError(decision.rationale or f"Policy denied: {name}")
-
-        try:
-            # Execute via nanoBot registry (preserves original behavior)
-            result = await self._registry.execute(name, params)
-
-            # Audit success
-            self._runtime.audit.log(
-                tool_call=call,
-                manifest=manifest,
-                policy_decision=decision,
-                executed=True,
-                result=result,
+            raise PolicyDeniedError(
+                decision.rationale or f"Policy denied: {name}", decision=decision
             )
 
-            return result
+        return await self._execute_and_audit(call, manifest, decision)
 
+    async def _execute_and_audit(
+        self,
+        call: ToolCall,
+        manifest: ToolManifest | None,
+        decision: PolicyDecision,
+    ) -> str:
+        """Run an allowed tool call and queue its audit record."""
+        try:
+            # Execute via nanoBot registry (preserves original behavior)
+            result = await self._registry.execute(call.tool_id, call.args)
         except (PolicyDeniedError, EmptinessActiveError, GateFailedError):
             # Re-raise FIT-Sec exceptions
             raise
         except Exception as e:
             # Audit failure
-            self._runtime.audit.log(
+            self._queue_audit(
                 tool_call=call,
                 manifest=manifest,
                 policy_decision=decision,
                 executed=True,
                 error=str(e),
+                timestamp=call.timestamp,
             )
             raise
 
+        # Audit success (outside the try: an audit failure is not a tool error)
+        self._queue_audit(
+            tool_call=call,
+            manifest=manifest,
+            policy_decision=decision,
+            executed=True,
+            result=result,
+            timestamp=call.timestamp,
+        )
+        return result
+
+    def _queue_audit(self, **record: Any) -> None:
+        """
+        Queue an audit record for the background writer.
+
+        The timestamp is taken now so batching does not skew it. Once
+        AUDIT_MAX_PENDING records are waiting they are written inline, which
+        bounds memory and slows the producer down instead of dropping entries.
+        If the previous drain task failed to write, its error is raised here
+        (this record stays queued).
+        """
+        record.setdefault("timestamp", time.time())
+        self._audit_buffer.append(record)
+        self._raise_audit_error()
+
+        pending = len(self._audit_buffer)
+        if pending >= AUDIT_MAX_PENDING:
+            self._hand_off_audit()
+            return
+
+        if self._audit_task is None or self._audit_task.done():
+            self._audit_task = asyncio.get_running_loop().create_task(self._audit_drain())
+        self._audit_pending.set()
+        if pending >= AUDIT_BATCH_SIZE:
+            self._audit_full.set()
+
+    async def _audit_drain(self) -> None:
+        """Flush queued audit records every AUDIT_BATCH_SIZE records or AUDIT_FLUSH_INTERVAL."""
+        while True:
+            await self._audit_pending.wait()
+            try:
+                await asyncio.wait_for(self._audit_full.wait(), AUDIT_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            batch = self._take_audit_batch()
+            if not batch:
+                continue
+            try:
+                # Waits for writer queue space without blocking the event loop
+                await self._runtime.audit.log_batch_async(batch)
+            except Exception as e:
+                # Keep it for the next _queue_audit()/flush_audit() to raise;
+                # that call starts a new drain task
+                logger.error(f"Audit log write failed: {e}")
+                self._audit_error = e
+                return
+
+    def flush_audit(self) -> None:
+        """Write all queued audit records and wait until they are on disk."""
+        self._raise_audit_error()
+        self._hand_off_audit()
+        self._runtime.audit.flush()
+
+    def _hand_off_audit(self) -> None:
+        """Pass queued records to the audit logger, whose writer thread does the I/O."""
+        batch = self._take_audit_batch()
+        if batch:
+            self._runtime.audit.log_batch(batch)
+
+    def _raise_audit_error(self) -> None:
+        """Raise (once) the error that stopped the background drain, if any."""
+        error, self._audit_error = self._audit_error, None
+        if error is not None:
+            raise error
+
+    def _take_audit_batch(self) -> list[dict[str, Any]]:
+        """Detach the queued audit records and reset the drain triggers."""
+        self._audit_pending.clear()
+        self._audit_full.clear()
+        batch, self._audit_buffer = self._audit_buffer, []
+        return batch
+
     @property
     def tool_names(self) -> list[str]:
         """Get list of registered tool names."""
@@ -285,6 +427,7 @@ class SecureToolRegistry:
 
     def emergency_stop(self, reason: str) -> None:
         """Trigger emergency stop."""
+        self.flush_audit()
         self._runtime.emergency_stop(reason)
 
     def __len__(self) -> int:
@@ -1,5 +1,6 @@
 """Spawn tool for creating background subagents."""
 
+from contextvars import ContextVar
 from typing import Any, TYPE_CHECKING
 
 from nanobot.agent.tools.base import Tool
@@ -7,6 +8,9 @@ from nanobot.agent.tools.base import Tool
 if TYPE_CHECKING:
     from nanobot.agent.subagent import SubagentManager
 
+# Per-task origin (channel, chat_id), so concurrently processed sessions don't clobber each other
+_origin: ContextVar[tuple[str, str] | None] = ContextVar("spawn_tool_origin", default=None)
+
 
 class SpawnTool(Tool):
     """
@@ -22,9 +26,8 @@ class SpawnTool(Tool):
         self._origin_chat_id = "direct"
     
     def set_context(self, channel: str, chat_id: str) -> None:
-        """Set the origin context for subagent announcements."""
-        self._origin_channel = channel
-        self._origin_chat_id = chat_id
+        """Set the origin context for subagent announcements (scoped to the running task)."""
+        _origin.set((channel, chat_id))
     
     @property
     def name(self) -> str:
@@ -57,9 +60,12 @@ class SpawnTool(Tool):
     
     async def execute(self, task: str, label: str | None = None, **kwargs: Any) -> str:
         """Spawn a subagent to execute the given task."""
+        origin_channel, origin_chat_id = _origin.get() or (
+            self._origin_channel, self._origin_chat_id
+        )
         return await self._manager.spawn(
             task=task,
             label=label,
-            origin_channel=self._origin_channel,
-            origin_chat_id=self._origin_chat_id,
+            origin_channel=origin_channel,
+            origin_chat_id=origin_chat_id,
         )
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InboundMessage:
     """Message received from a chat channel."""
     
@@ -23,7 +23,7 @@ class InboundMessage:
         return f"{self.channel}:{self.chat_id}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OutboundMessage:
     """Message to send to a chat channel."""
     
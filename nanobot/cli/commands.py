@@ -31,7 +31,16 @@ def main(
     ),
 ):
     """nanobot - Personal AI Assistant."""
-    pass
+    _use_uvloop()
+
+
+def _use_uvloop() -> None:
+    """Run asyncio on uvloop when it is installed (optional, not on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 # ============================================================================
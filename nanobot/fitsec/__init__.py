@@ -49,8 +49,10 @@ from .types import (
     ToolManifest,
     ToolCall,
     GateMetrics,
+    GateCheckResult,
     PolicyDecision,
     AuditEntry,
+    DecisionResult,
     FitSecError,
     ToolNotRegisteredError,
     PolicyDeniedError,
@@ -75,8 +77,10 @@ __all__ = [
     "ToolManifest",
     "ToolCall",
     "GateMetrics",
+    "GateCheckResult",
     "PolicyDecision",
     "AuditEntry",
+    "DecisionResult",
     "ReviewPacket",
     # Exceptions
     "FitSecError",
@@ -4,19 +4,535 @@ FIT-Sec Audit Logger
 Append-only event stream for tool call decisions and executions.
 """
 from __future__ import annotations
+import asyncio
+import itertools
 import json
+import os
+import queue
+import secrets
+from collections import Counter, defaultdict, deque
+from itertools import islice
+import threading
 import time
-import uuid
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 from .types import (
     AuditEntry,
+    Decision,
+    OmegaLevel,
     PolicyDecision,
     ToolCall,
     ToolManifest,
 )
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional, see _AuditRecord
+    msgspec = None
+
+
+# Shared stdlib encoder (compact, like orjson) instead of a fresh one per json.dumps call
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    """Encode one audit record as a JSONL line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record) + b"\n"
+        except TypeError:
+            pass  # e.g. non-str keys or huge ints; stdlib json copes
+    return (_json_encode(record) + "\n").encode("utf-8")
+
+
+if msgspec is not None:
+    # Fixed-shape mirror of the JSONL record: msgspec encodes these straight
+    # to bytes in one pass, with no intermediate dicts. Field order is the
+    # on-disk key order, same as _entry_to_dict().
+
+    class _ToolCallRecord(msgspec.Struct, gc=False):
+        tool_id: str
+        action: str
+        args: Dict[str, Any]
+
+    class _DecisionRecord(msgspec.Struct, gc=False):
+        decision: str
+        omega_level: str
+        gate_status: str
+        rationale: str
+        timestamp: float
+
+    class _AuditRecord(msgspec.Struct, gc=False):
+        entry_id: str
+        timestamp: float
+        timestamp_iso: str
+        tool_call: _ToolCallRecord
+        manifest: Optional[Dict[str, Any]]
+        decision: _DecisionRecord
+        executed: bool
+        result_type: Optional[str]
+        error: Optional[str]
+
+    _msgspec_encode = msgspec.json.Encoder().encode
+
+
+# (second, ISO string) of the last timestamp formatted; entries logged in the
+# same second reuse the string
+_iso_cache: Tuple[Optional[int], str] = (None, "")
+
+
+def _iso_timestamp(ts: float) -> str:
+    """Format `ts` as ISO-8601 UTC, reusing the string within the same second."""
+    global _iso_cache
+    second = int(ts)
+    cached_second, iso = _iso_cache
+    if second != cached_second:
+        iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _iso_cache = (second, iso)
+    return iso
+
+
+def _encode_entry(entry: AuditEntry) -> bytes:
+    """
+    Encode an entry as one JSONL line (via msgspec when it is installed).
+
+    For JSON-typed args the line is byte-identical to the dict path. Other
+    arg types depend on the encoders installed: msgspec and orjson encode
+    datetime, UUID and dataclasses natively, msgspec also sets and bytes
+    (as base64), while the stdlib fallback fails and the writer records an
+    `encode_error` line instead.
+    """
+    if msgspec is not None:
+        call = entry.tool_call
+        decision = entry.policy_decision
+        manifest = entry.manifest
+        result = entry.result
+        ts = entry.timestamp
+        record = _AuditRecord(
+            entry_id=entry.entry_id,
+            timestamp=ts,
+            timestamp_iso=_iso_timestamp(ts),
+            tool_call=_ToolCallRecord(call.tool_id, call.action, call.args),
+            manifest=manifest.to_dict() if manifest else None,
+            decision=_DecisionRecord(
+                decision.decision.name,
+                decision.omega_level.name,
+                decision.gate_status.name,
+                decision.rationale,
+                decision.timestamp,
+            ),
+            executed=entry.executed,
+            result_type=type(result).__name__ if result else None,
+            error=entry.error,
+        )
+        try:
+            return _msgspec_encode(record) + b"\n"
+        except (TypeError, msgspec.EncodeError):
+            pass  # unusual args (e.g. non-str keys); the dict path copes
+    return _encode_record(_entry_to_dict(entry))
+
+
+def _entry_to_dict(entry: AuditEntry) -> Dict[str, Any]:
+    """Convert entry to serializable dict."""
+    call = entry.tool_call
+    manifest = entry.manifest
+    result = entry.result
+    ts = entry.timestamp
+    return {
+        "entry_id": entry.entry_id,
+        "timestamp": ts,
+        "timestamp_iso": _iso_timestamp(ts),
+        "tool_call": {
+            "tool_id": call.tool_id,
+            "action": call.action,
+            "args": call.args,
+        },
+        "manifest": manifest.to_dict() if manifest else None,
+        "decision": entry.policy_decision.to_dict(),
+        "executed": entry.executed,
+        "result_type": type(result).__name__ if result else None,
+        "error": entry.error,
+    }
+
+
+def _encode_entry_safely(entry: AuditEntry) -> bytes:
+    """Encode an entry; if its args can't be serialized, record that instead."""
+    try:
+        return _encode_entry(entry)
+    except Exception as e:
+        return _encode_record({
+            "entry_id": entry.entry_id,
+            "timestamp": entry.timestamp,
+            "timestamp_iso": _iso_timestamp(entry.timestamp),
+            "tool_call": {"tool_id": entry.tool_call.tool_id, "action": entry.tool_call.action},
+            "decision": entry.policy_decision.to_dict(),
+            "executed": entry.executed,
+            "error": entry.error,
+            "encode_error": repr(e),
+        })
+
+
+# Summaries count enum members and only resolve names when reporting
+_OMEGA_NAMES = {o: o.name for o in OmegaLevel}
+
+
+# Entry IDs are a random per-process prefix plus a process-wide counter:
+# unique within a run without a urandom() syscall per entry.
+_id_prefix = secrets.token_hex(4)
+_id_seq = itertools.count()
+
+
+def _reset_entry_ids() -> None:
+    global _id_prefix, _id_seq
+    _id_prefix = secrets.token_hex(4)
+    _id_seq = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_entry_ids)
+
+
+def _next_entry_id() -> str:
+    return f"{_id_prefix}-{next(_id_seq):08x}"
+
+
+_STOP = None  # queue sentinel: flush, close the file and exit
+
+# How long log_async() sleeps before retrying a full writer queue, seconds
+ASYNC_WRITE_RETRY = 0.01
+
+_PRODUCER_THREAD_ERROR = (
+    "single_producer audit logger used from a second thread; log, flush and "
+    "close from one thread or use single_producer=False"
+)
+
+# Encoded lines, entries to encode, a flush marker, or _STOP
+_QueueItem = Union[bytes, List[AuditEntry], threading.Event, None]
+
+# The writer's batch buffer is reused between batches; one that grew past
+# this after a burst is dropped instead so its memory is released.
+WRITE_BUFFER_SOFT_MAX = 128 * 1024
+
+
+class _SpscRing:
+    """
+    Bounded single-producer/single-consumer queue with no lock on the fast path.
+
+    A preallocated ring plus two indices, each advanced by one side only;
+    the GIL makes the slot store and index bump visible in order. Events are
+    only touched when the other side is (about to be) asleep, with timeouts
+    as a backstop. Implements the subset of `queue.Queue` used by
+    `_AuditWriter`. Only safe with exactly one producer thread.
+    """
+
+    _WAIT = 0.05  # seconds between re-checks while blocked
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("ring capacity must be positive")
+        self._ring: List[Any] = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # next slot to fill (producer only)
+        self._tail = 0  # next slot to take (consumer only)
+        self._items_ready = threading.Event()
+        self._space_ready = threading.Event()
+        self._consumer_waiting = False
+        self._producer_waiting = False
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        deadline = None
+        while self._head - self._tail >= self._capacity:
+            if not block:
+                raise queue.Full
+            if timeout is not None:
+                if deadline is None:
+                    deadline = time.monotonic() + timeout
+                elif time.monotonic() >= deadline:
+                    raise queue.Full
+            self._space_ready.clear()
+            self._producer_waiting = True
+            if self._head - self._tail >= self._capacity:
+                self._space_ready.wait(self._WAIT)
+            self._producer_waiting = False
+        self._ring[self._head % self._capacity] = item
+        self._head += 1
+        if self._consumer_waiting:
+            self._items_ready.set()
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        if self._tail == self._head:
+            self._items_ready.clear()
+            self._consumer_waiting = True
+            if self._tail == self._head:
+                self._items_ready.wait(timeout)
+            self._consumer_waiting = False
+            if self._tail == self._head:
+                raise queue.Empty
+        return self._take()
+
+    def get_nowait(self) -> Any:
+        if self._tail == self._head:
+            raise queue.Empty
+        return self._take()
+
+    def empty(self) -> bool:
+        return self._tail == self._head
+
+    def _take(self) -> Any:
+        index = self._tail % self._capacity
+        item = self._ring[index]
+        self._ring[index] = None
+        self._tail += 1
+        if self._producer_waiting:
+            self._space_ready.set()
+        return item
+
+
+class _AuditWriter:
+    """
+    Background thread appending encoded lines to the audit file.
+
+    Lines (or lists of entries, encoded here rather than on the logging
+    thread) are pushed onto a bounded queue; the thread drains whatever has
+    piled up (up to `max_batch` items) into a reused bytearray that goes out
+    in a single write, and flushes to the OS once the queue runs dry or
+    `flush_interval` has passed since the last flush. The file handle stays
+    open for the writer's lifetime.
+
+    With `single_producer=True` the queue is a lock-free `_SpscRing`; all
+    writes, flushes and closes must then come from the thread that created
+    the writer (asserted, so checked unless Python runs with -O). The exit
+    finalizer is the exception, see `_close_at_exit()`.
+
+    `durability` controls fsync: "none" leaves it to the OS, "periodic"
+    fsyncs at most every `fsync_interval` seconds, "per_record" after every
+    batch written (and before a flush() returns).
+
+    If opening or writing the file fails, the thread stops and the error is
+    raised from the next `write()` or `flush()`, and once from `close()`.
+    """
+
+    _WAIT = 0.05  # seconds between checks that the thread is still alive
+
+    def __init__(
+        self,
+        path: Path,
+        buffer_size: int,
+        flush_interval: float,
+        max_queue: int,
+        single_producer: bool = False,
+        durability: str = "none",
+        fsync_interval: float = 1.0,
+        max_batch: int = 1024,
+    ):
+        self._path = path
+        self._durability = durability
+        self._fsync_interval = fsync_interval
+        self._dirty = False     # written to the file object, not yet flushed
+        self._unsynced = False  # flushed to the OS, not yet fsynced
+        self._last_flush = self._last_fsync = 0.0
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._wbuf = bytearray()
+        self._error: Optional[Exception] = None  # what stopped the thread, if anything
+        # Only thread allowed to queue items when the ring is used
+        self._producer = threading.get_ident() if single_producer else None
+        self._queue: "Union[queue.Queue[_QueueItem], _SpscRing]" = (
+            _SpscRing(max_queue) if single_producer else queue.Queue(max_queue)
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="fitsec-audit-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, data: Union[bytes, List[AuditEntry]], block: bool = True) -> bool:
+        """
+        Queue encoded lines or a list of entries to encode; with block=False,
+        return False instead of waiting when full.
+        """
+        if not block:
+            assert self._producer in (None, threading.get_ident()), _PRODUCER_THREAD_ERROR
+            self._raise_error()
+            try:
+                self._queue.put(data, block=False)
+            except queue.Full:
+                return False
+            return True
+        self._put(data)
+        return True
+
+    def flush(self) -> None:
+        """Block until everything queued so far has reached the OS."""
+        done = threading.Event()
+        self._put(done)
+        while not done.wait(self._WAIT):
+            if not self._thread.is_alive():
+                break
+        self._raise_error()
+
+    def close(self) -> None:
+        """Drain the queue, close the file and stop the thread."""
+        if self._thread.is_alive():
+            self._put(_STOP)
+            self._thread.join()
+        # Reported once: the logger drops a closed writer, but the exit
+        # finalizer may still call close() again
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _put(self, item: _QueueItem) -> None:
+        """Queue an item, waiting for space for as long as the thread is alive."""
+        assert self._producer in (None, threading.get_ident()), _PRODUCER_THREAD_ERROR
+        while True:
+            self._raise_error()
+            try:
+                self._queue.put(item, timeout=self._WAIT)
+                return
+            except queue.Full:
+                pass
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        try:
+            self._write_loop()
+        except Exception as e:
+            self._error = e
+
+    def _write_loop(self) -> None:
+        with open(self._path, "ab", buffering=self._buffer_size) as fh:
+            self._last_flush = self._last_fsync = time.monotonic()
+            while True:
+                try:
+                    items = [self._queue.get(timeout=self._flush_interval)]
+                except queue.Empty:
+                    items = []
+                while items and len(items) < self._max_batch:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                for item in items:
+                    if isinstance(item, bytes):
+                        self._wbuf += item
+                        continue
+                    if isinstance(item, list):
+                        for entry in item:
+                            self._wbuf += _encode_entry_safely(entry)
+                        continue
+                    # flush/stop marker: everything queued before it goes out now
+                    self._write_batch(fh)
+                    if self._durability == "per_record" or (
+                        item is _STOP and self._durability != "none"
+                    ):
+                        self._fsync(fh)
+                    else:
+                        self._flush(fh)
+                    if item is _STOP:
+                        return
+                    item.set()
+                self._write_batch(fh)
+
+                now = time.monotonic()
+                if self._dirty and (
+                    self._queue.empty() or now - self._last_flush >= self._flush_interval
+                ):
+                    self._flush(fh)
+                if (self._dirty or self._unsynced) and (
+                    self._durability == "per_record"
+                    or (
+                        self._durability == "periodic"
+                        and now - self._last_fsync >= self._fsync_interval
+                    )
+                ):
+                    self._fsync(fh)
+
+    def _flush(self, fh: Any) -> None:
+        """Hand buffered bytes to the OS (survives a process crash, not a power loss)."""
+        fh.flush()
+        self._dirty = False
+        self._unsynced = True
+        self._last_flush = time.monotonic()
+
+    def _fsync(self, fh: Any) -> None:
+        """Force everything written so far onto stable storage."""
+        if self._dirty:
+            self._flush(fh)
+        if not self._unsynced:
+            return
+        os.fsync(fh.fileno())
+        self._unsynced = False
+        self._last_fsync = time.monotonic()
+
+    def _write_batch(self, fh: Any) -> None:
+        """Write out the batch buffer and reset it for the next batch."""
+        if not self._wbuf:
+            return
+        fh.write(self._wbuf)
+        self._dirty = True
+        if len(self._wbuf) > WRITE_BUFFER_SOFT_MAX:
+            self._wbuf = bytearray()
+        else:
+            self._wbuf.clear()
+
+
+class _AggregateWindow:
+    """Counts of aggregated calls in the current window (see AuditLogger)."""
+
+    __slots__ = ("counts", "start")
+
+    def __init__(self):
+        self.counts: Counter[Tuple[str, OmegaLevel, Decision]] = Counter()
+        self.start: Optional[float] = None
+
+    def take_lines(self, window_end: float) -> List[bytes]:
+        """Encode one line per counted (tool, omega, decision) and start a new window."""
+        lines = [
+            _encode_record({
+                "aggregate": True,
+                "tool_id": tool_id,
+                "omega_level": _OMEGA_NAMES[omega],
+                "decision": decision.name,
+                "count": count,
+                "window_start": self.start,
+                "window_end": window_end,
+            })
+            for (tool_id, omega, decision), count in self.counts.items()
+        ]
+        self.counts.clear()
+        self.start = None
+        return lines
+
+
+def _close_at_exit(
+    writer: _AuditWriter,
+    window: _AggregateWindow,
+    waiting: Deque[List[AuditEntry]],
+) -> None:
+    """Finalizer: write waiting batches and the open aggregate window, then close the file."""
+    # Runs once the logger is unreachable (so nothing else can log to it) or
+    # at exit, after non-daemon threads have been joined; either way there is
+    # no producer left to race, so the single-producer owner check is lifted.
+    writer._producer = None
+    while waiting:
+        writer.write(waiting.popleft())
+    lines = window.take_lines(time.time())
+    if lines:
+        writer.write(b"".join(lines))
+    writer.close()
+
 
 class AuditLogger:
     """
@@ -28,16 +544,97 @@ class AuditLogger:
     - Policy decision + rationale
     - Gate metrics snapshot
     - Execution result or error
+
+    File writes happen on a background thread (see `_AuditWriter`), which
+    also does the JSON encoding, so don't mutate a logged call's args. Keep
+    args to JSON types: how anything else (datetime, UUID, sets, bytes,
+    dataclasses) is written depends on whether msgspec or orjson is
+    installed, see `_encode_entry()`. Call
+    `flush()` when the log must be on disk, e.g. before reading it back.
+    An I/O error on that thread is raised from the next `log()`, `flush()`
+    or `close()`; after `close()` the next write tries the file again.
+    The thread writes whatever has queued up, at most `max_batch` writes at
+    a time, as one batch, and flushes it once the queue is empty or
+    `flush_interval_ms` has passed.
+
+    At most `max_queue` writes wait for the writer thread. Pass
+    `single_producer=True` when only one thread ever logs, flushes and
+    closes (e.g. a single asyncio loop) to use a lock-free ring instead of
+    `queue.Queue`; calls from another thread fail an assertion. When the
+    queue is full, `on_overflow="block"` (default) makes the caller wait,
+    while `"drop"` discards the write and counts it in `dropped_count`.
+
+    `durability` sets how much a crash can lose. Queued lines are always
+    lost if the process dies before the writer thread gets to them.
+    - "none" (default): never fsync. Flushed lines survive a process crash,
+      but an OS crash or power loss can drop whatever the page cache holds.
+    - "periodic": also fsync every `fsync_interval_ms`, which bounds that
+      window.
+    - "per_record": fsync after every batch the writer thread writes. This
+      is the slowest mode and loses the least.
+
+    Only the latest `max_in_memory` entries are kept for `get_entries()`;
+    the JSONL file is the full history. Kept entries hold on to their
+    `result`, so `max_in_memory` also bounds how many results stay alive.
+
+    `aggregate` lists (omega_level, decision) pairs whose successful calls
+    (executed, no error) are only counted, e.g. `{(OMEGA_0, ALLOW)}` for
+    routine reads. No entry is built for them; instead one line per tool,
+    `{"aggregate": true, "tool_id": ..., "count": ...}` with the window
+    bounds, is written when a window of at least `aggregate_interval_ms` is
+    closed by the next aggregated call, and for the open window on
+    `flush()`, `close()` and when the logger is garbage collected or the
+    interpreter exits. There is no timer: a window with no later calls stays
+    open until one of those. Aggregated calls still count in
+    `get_summary()` but never show up in `get_entries()`.
     """
 
     def __init__(
         self,
         log_path: Optional[Path] = None,
         in_memory: bool = False,
+        buffer_size: int = 1 << 16,
+        flush_interval_ms: float = 50,
+        max_in_memory: int = 10_000,
+        max_queue: int = 10_000,
+        on_overflow: Literal["block", "drop"] = "block",
+        single_producer: bool = False,
+        durability: Literal["none", "periodic", "per_record"] = "none",
+        fsync_interval_ms: float = 1000,
+        max_batch: int = 1024,
+        aggregate: Iterable[Tuple[OmegaLevel, Decision]] = (),
+        aggregate_interval_ms: float = 1000,
     ):
+        if on_overflow not in ("block", "drop"):
+            raise ValueError(f"on_overflow must be 'block' or 'drop', not {on_overflow!r}")
+        if durability not in ("none", "periodic", "per_record"):
+            raise ValueError(
+                f"durability must be 'none', 'periodic' or 'per_record', not {durability!r}"
+            )
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be at least 1, not {max_batch!r}")
         self._log_path = log_path
         self._in_memory = in_memory
-        self._entries: List[AuditEntry] = []
+        self._max_in_memory = max_in_memory
+        self._entries: Deque[AuditEntry] = deque(maxlen=max_in_memory)
+        self._reset_indices()
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._max_queue = max_queue
+        self._block_on_overflow = on_overflow == "block"
+        self._single_producer = single_producer
+        self._durability = durability
+        self._fsync_interval = fsync_interval_ms / 1000
+        self._max_batch = max_batch
+        self._dropped = 0
+        self._aggregate = frozenset(aggregate)
+        self._aggregate_interval = aggregate_interval_ms / 1000
+        self._window = _AggregateWindow()
+        # Batches log_async() is waiting to queue, oldest first; later writes
+        # and flush() hand these over first so file order is kept
+        self._waiting: Deque[List[AuditEntry]] = deque()
+        self._writer: Optional[_AuditWriter] = None
+        self._finalizer: Optional[weakref.finalize] = None
 
         # Ensure log directory exists
         if log_path and not in_memory:
@@ -51,51 +648,275 @@ class AuditLogger:
         executed: bool,
         result: Optional[Any] = None,
         error: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> Optional[AuditEntry]:
+        """Log a tool call decision and outcome (None if only aggregated)."""
+        entry = self._record(
+            tool_call, manifest, policy_decision, executed, result, error, timestamp
+        )
+        if entry is not None and self._log_path and not self._in_memory:
+            self._append_to_file([entry])
+        return entry
+
+    async def log_async(
+        self,
+        tool_call: ToolCall,
+        manifest: Optional[ToolManifest],
+        policy_decision: PolicyDecision,
+        executed: bool,
+        result: Optional[Any] = None,
+        error: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> Optional[AuditEntry]:
+        """
+        Like `log()`, but when the writer queue is full it yields to the event
+        loop until there is room instead of blocking the loop's thread.
+        """
+        entry = self._record(
+            tool_call, manifest, policy_decision, executed, result, error, timestamp
+        )
+        if entry is not None and self._log_path and not self._in_memory:
+            await self._append_to_file_async([entry])
+        return entry
+
+    def log_batch(self, records: Iterable[Dict[str, Any]]) -> List[AuditEntry]:
+        """
+        Log several decisions at once.
+
+        Each record holds the keyword arguments of `log()`. All resulting
+        lines are handed to the writer thread as a single write. Aggregated
+        records produce no entry.
+        """
+        entries = self._record_batch(records)
+        if entries and self._log_path and not self._in_memory:
+            self._append_to_file(entries)
+
+        return entries
+
+    async def log_batch_async(self, records: Iterable[Dict[str, Any]]) -> List[AuditEntry]:
+        """`log_batch()` that waits for writer queue space like `log_async()`."""
+        entries = self._record_batch(records)
+        if entries and self._log_path and not self._in_memory:
+            await self._append_to_file_async(entries)
+
+        return entries
+
+    def _record_batch(self, records: Iterable[Dict[str, Any]]) -> List[AuditEntry]:
+        """Aggregate, or build, keep and index an entry for each record."""
+        if self._aggregate:
+            records = [
+                record for record in records
+                if not self._count_aggregated(
+                    record["tool_call"],
+                    record["policy_decision"],
+                    record["executed"],
+                    record.get("error"),
+                    record.get("timestamp"),
+                )
+            ]
+        entries = [self._make_entry(**record) for record in records]
+        for entry in entries:
+            self._keep(entry)
+        return entries
+
+    def _record(
+        self,
+        tool_call: ToolCall,
+        manifest: Optional[ToolManifest],
+        policy_decision: PolicyDecision,
+        executed: bool,
+        result: Optional[Any],
+        error: Optional[str],
+        timestamp: Optional[float],
+    ) -> Optional[AuditEntry]:
+        """Aggregate, or build, keep and index an entry for one call."""
+        if self._aggregate and self._count_aggregated(
+            tool_call, policy_decision, executed, error, timestamp
+        ):
+            return None
+        entry = self._make_entry(
+            tool_call, manifest, policy_decision, executed, result, error, timestamp
+        )
+        self._keep(entry)
+        return entry
+
+    def _reset_indices(self) -> None:
+        """Start empty query indices and summary counters."""
+        # Per-tool views of _entries; trimmed as _entries evicts
+        self._by_tool: defaultdict[str, Deque[AuditEntry]] = defaultdict(deque)
+        self._total = 0
+        self._decision_counts: Counter[Decision] = Counter()
+        self._omega_counts: Counter[OmegaLevel] = Counter()
+        self._executed = 0
+        self._errors = 0
+
+    def _keep(self, entry: AuditEntry) -> None:
+        """Add a new entry to the in-memory window, query indices and summary counters."""
+        entries = self._entries
+        if entries and len(entries) == entries.maxlen:
+            # Appending evicts the oldest entry, which is also the oldest of its tool
+            tool_id = entries[0].tool_call.tool_id
+            by_tool = self._by_tool[tool_id]
+            by_tool.popleft()
+            if not by_tool:
+                del self._by_tool[tool_id]
+        entries.append(entry)
+        if entries.maxlen != 0:
+            self._by_tool[entry.tool_call.tool_id].append(entry)
+
+        decision = entry.policy_decision
+        self._total += 1
+        self._decision_counts[decision.decision] += 1
+        self._omega_counts[decision.omega_level] += 1
+        if entry.executed:
+            self._executed += 1
+        if entry.error:
+            self._errors += 1
+
+    def _count_aggregated(
+        self,
+        tool_call: ToolCall,
+        policy_decision: PolicyDecision,
+        executed: bool,
+        error: Optional[str],
+        timestamp: Optional[float],
+    ) -> bool:
+        """Count a successful call in the current window if it is aggregated."""
+        omega = policy_decision.omega_level
+        decision = policy_decision.decision
+        if not executed or error or (omega, decision) not in self._aggregate:
+            return False
+
+        now = timestamp if timestamp is not None else time.time()
+        window = self._window
+        if window.start is None:
+            window.start = now
+            if self._log_path and not self._in_memory:
+                self._get_writer()  # so the exit finalizer covers this window
+        elif now - window.start >= self._aggregate_interval:
+            self._emit_aggregates(now)
+            window.start = now
+        window.counts[(tool_call.tool_id, omega, decision)] += 1
+
+        self._total += 1
+        self._decision_counts[decision] += 1
+        self._omega_counts[omega] += 1
+        self._executed += 1
+        return True
+
+    def _emit_aggregates(self, window_end: float) -> None:
+        """Write one line per tool for the counts of the closing window."""
+        lines = self._window.take_lines(window_end)
+        if lines and self._log_path and not self._in_memory:
+            self._write_lines(b"".join(lines), len(lines))
+
+    def _make_entry(
+        self,
+        tool_call: ToolCall,
+        manifest: Optional[ToolManifest],
+        policy_decision: PolicyDecision,
+        executed: bool,
+        result: Optional[Any] = None,
+        error: Optional[str] = None,
+        timestamp: Optional[float] = None,
     ) -> AuditEntry:
-        """Log a tool call decision and outcome."""
-        entry = AuditEntry(
-            entry_id=str(uuid.uuid4()),
+        """Build an audit entry (timestamp defaults to now)."""
+        return AuditEntry(
+            entry_id=_next_entry_id(),
             tool_call=tool_call,
             manifest=manifest,
             policy_decision=policy_decision,
             executed=executed,
             result=result,
             error=error,
-            timestamp=time.time(),
+            timestamp=timestamp if timestamp is not None else time.time(),
         )
 
-        self._entries.append(entry)
+    def _append_to_file(self, entries: List[AuditEntry]) -> None:
+        """Queue entries for the JSONL file; the writer thread encodes them."""
+        self._write_lines(entries, len(entries))
 
-        if self._log_path and not self._in_memory:
-            self._append_to_file(entry)
+    async def _append_to_file_async(self, entries: List[AuditEntry]) -> None:
+        """
+        Queue entries like `_append_to_file()`, sleeping while the queue is full.
 
-        return entry
+        A waiting batch sits in `_waiting`, where a synchronous write, flush()
+        or close() may hand it over first; it is written exactly once.
+        """
+        if not self._waiting:
+            if self._get_writer().write(entries, block=False):
+                return
+            if not self._block_on_overflow:
+                self._dropped += len(entries)
+                return
+        waiting = self._waiting
+        waiting.append(entries)
+        while True:
+            self._hand_off_waiting(block=False)
+            if not any(batch is entries for batch in waiting):
+                return
+            await asyncio.sleep(ASYNC_WRITE_RETRY)
 
-    def _append_to_file(self, entry: AuditEntry) -> None:
-        """Append entry to JSONL file."""
-        record = self._entry_to_dict(entry)
-        with open(self._log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    def _hand_off_waiting(self, block: bool) -> None:
+        """Queue batches left by log_async(), oldest first, until one doesn't fit."""
+        waiting = self._waiting
+        writer = self._get_writer()
+        while waiting:
+            if not writer.write(waiting[0], block=block):
+                return
+            waiting.popleft()
 
-    def _entry_to_dict(self, entry: AuditEntry) -> Dict[str, Any]:
-        """Convert entry to serializable dict."""
-        return {
-            "entry_id": entry.entry_id,
-            "timestamp": entry.timestamp,
-            "timestamp_iso": time.strftime(
-                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(entry.timestamp)
-            ),
-            "tool_call": {
-                "tool_id": entry.tool_call.tool_id,
-                "action": entry.tool_call.action,
-                "args": entry.tool_call.args,
-            },
-            "manifest": entry.manifest.to_dict() if entry.manifest else None,
-            "decision": entry.policy_decision.to_dict(),
-            "executed": entry.executed,
-            "result_type": type(entry.result).__name__ if entry.result else None,
-            "error": entry.error,
-        }
+    def _write_lines(self, data: Union[bytes, List[AuditEntry]], count: int) -> None:
+        """Hand `count` lines to the writer thread."""
+        if self._waiting:
+            self._hand_off_waiting(block=True)
+        if not self._get_writer().write(data, block=self._block_on_overflow):
+            self._dropped += count
+
+    def _get_writer(self) -> _AuditWriter:
+        """Return the writer thread, starting it on first use."""
+        if self._writer is None:
+            self._writer = _AuditWriter(
+                self._log_path,
+                self._buffer_size,
+                self._flush_interval,
+                self._max_queue,
+                self._single_producer,
+                self._durability,
+                self._fsync_interval,
+                self._max_batch,
+            )
+            # Don't lose buffered lines or the open aggregate window if the
+            # logger is dropped or at exit
+            self._finalizer = weakref.finalize(
+                self, _close_at_exit, self._writer, self._window, self._waiting
+            )
+        return self._writer
+
+    @property
+    def dropped_count(self) -> int:
+        """Entries not written to the file because the queue was full (drop policy)."""
+        return self._dropped
+
+    def flush(self) -> None:
+        """Block until all logged entries have been written to the file."""
+        if self._waiting:
+            self._hand_off_waiting(block=True)
+        if self._window.counts:
+            self._emit_aggregates(time.time())
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and close the audit log file (reopened on the next write)."""
+        if self._waiting:
+            self._hand_off_waiting(block=True)
+        if self._window.counts:
+            self._emit_aggregates(time.time())
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            self._finalizer.detach()
+            writer.close()
 
     def get_entries(
         self,
@@ -103,61 +924,51 @@ class AuditLogger:
         tool_id: Optional[str] = None,
         decision_filter: Optional[str] = None,
     ) -> List[AuditEntry]:
-        """Query audit entries."""
-        entries = self._entries
+        """Query the most recent audit entries (oldest first)."""
+        entries: Iterable[AuditEntry] = self._entries
 
         if tool_id:
-            entries = [e for e in entries if e.tool_call.tool_id == tool_id]
+            entries = self._by_tool.get(tool_id, ())
 
         if decision_filter:
-            entries = [
-                e for e in entries
-                if e.policy_decision.decision.name == decision_filter
-            ]
+            # Resolve the name once; the scan then compares members by identity
+            wanted = Decision.__members__.get(decision_filter)
+            entries = [e for e in entries if e.policy_decision.decision is wanted]
 
         if limit:
-            entries = entries[-limit:]
+            return list(islice(reversed(entries), limit))[::-1]
 
-        return entries
+        return list(entries)
 
     def get_summary(self) -> Dict[str, Any]:
-        """Get summary statistics."""
-        total = len(self._entries)
+        """Get summary statistics for everything logged since creation or `clear()`."""
+        total = self._total
         if total == 0:
             return {"total": 0}
 
-        allowed = sum(
-            1 for e in self._entries
-            if e.policy_decision.decision.name == "ALLOW"
-        )
-        denied = sum(
-            1 for e in self._entries
-            if e.policy_decision.decision.name == "DENY"
-        )
-        executed = sum(1 for e in self._entries if e.executed)
-        errors = sum(1 for e in self._entries if e.error)
-
-        by_omega = {}
-        for e in self._entries:
-            omega = e.policy_decision.omega_level.name
-            by_omega[omega] = by_omega.get(omega, 0) + 1
-
         return {
             "total": total,
-            "allowed": allowed,
-            "denied": denied,
-            "executed": executed,
-            "errors": errors,
-            "by_omega_level": by_omega,
+            "allowed": self._decision_counts[Decision.ALLOW],
+            "denied": self._decision_counts[Decision.DENY],
+            "executed": self._executed,
+            "errors": self._errors,
+            "by_omega_level": {
+                _OMEGA_NAMES[omega]: count for omega, count in self._omega_counts.items()
+            },
+            "dropped": self._dropped,
         }
 
     def export_jsonl(self, path: Path) -> None:
-        """Export all entries to JSONL file."""
-        with open(path, "w", encoding="utf-8") as f:
-            for entry in self._entries:
-                record = self._entry_to_dict(entry)
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        """Export all in-memory entries to a JSONL file."""
+        # Large buffer: writelines coalesces lines into few big writes
+        with open(path, "wb", buffering=1 << 20) as f:
+            f.writelines(
+                map(_encode_entry, self._entries)
+            )
 
     def clear(self) -> None:
         """Clear in-memory entries (does not affect file log)."""
-        self._entries = []
+        self._entries.clear()
+        self._window.counts.clear()
+        self._window.start = None
+        self._reset_indices()
@@ -9,19 +9,34 @@ This implements the "Controlled Nirvana" concept from FIT Phase II:
 - Generate review packets for human oversight
 """
 from __future__ import annotations
+import dataclasses
+import json
 import time
+import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .types import EmptinessState, OmegaLevel, ToolCall
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
 
-@dataclass
+_now = time.time
+_uuid4 = uuid.uuid4
+
+# Levels allowed in each state; NORMAL also covers UNKNOWN
+_ALLOW_ALL = frozenset(OmegaLevel)
+_ALLOW_OMEGA0 = frozenset({OmegaLevel.OMEGA_0})
+
+
+@dataclass(slots=True)
 class ReviewPacket:
     """Human review artifact generated during Emptiness mode."""
     packet_id: str
     timestamp: float
-    blocked_calls: List[ToolCall]
+    blocked_calls: Tuple[ToolCall, ...]
     proposed_plan: Optional[str] = None
     dry_run_diffs: List[Dict[str, Any]] = field(default_factory=list)
     context_summary: Optional[str] = None
@@ -41,6 +56,17 @@ class ReviewPacket:
             "recommendation": self.recommendation,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the full packet, including each blocked call's context and timestamp.
+
+        orjson encodes the dataclasses directly, skipping the dict building
+        that `to_dict()` does.
+        """
+        if orjson is not None:
+            return orjson.dumps(self)
+        return json.dumps(dataclasses.asdict(self), ensure_ascii=False).encode("utf-8")
+
 
 class EmptinessWindow:
     """
@@ -55,10 +81,17 @@ class EmptinessWindow:
 
     def __init__(self):
         self._state = EmptinessState.NORMAL
+        # Levels allowed right now, swapped on activate()/deactivate(); hot
+        # paths can test `omega in window.allowed_omegas` directly. Read-only.
+        self.allowed_omegas: frozenset[OmegaLevel] = _ALLOW_ALL
+        self.version = 0  # bumped whenever check_allowed() results may change
         self._activated_at: Optional[float] = None
         self._activation_reason: str = ""
         self._blocked_calls: List[ToolCall] = []
         self._review_packets: List[ReviewPacket] = []
+        # Read-only snapshots handed to callers, rebuilt only after a change
+        self._blocked_snapshot: Optional[Tuple[ToolCall, ...]] = ()
+        self._packets_snapshot: Optional[Tuple[ReviewPacket, ...]] = ()
 
     @property
     def state(self) -> EmptinessState:
@@ -79,9 +112,12 @@ class EmptinessWindow:
         """
         if self._state == EmptinessState.NORMAL:
             self._state = EmptinessState.EMPTINESS
-            self._activated_at = time.time()
+            self.allowed_omegas = _ALLOW_OMEGA0
+            self.version += 1
+            self._activated_at = _now()
             self._activation_reason = reason
             self._blocked_calls = []
+            self._blocked_snapshot = ()
 
     def deactivate(self, require_review: bool = True) -> Optional[ReviewPacket]:
         """
@@ -96,9 +132,12 @@ class EmptinessWindow:
                 packet = self._generate_review_packet()
 
             self._state = EmptinessState.NORMAL
+            self.allowed_omegas = _ALLOW_ALL
+            self.version += 1
             self._activated_at = None
             self._activation_reason = ""
             self._blocked_calls = []
+            self._blocked_snapshot = ()
 
         return packet
 
@@ -110,27 +149,24 @@ class EmptinessWindow:
         - Ω0 (safe reads): allowed
         - Ω1/Ω2: blocked
         """
-        if self._state == EmptinessState.NORMAL:
-            return True
-
-        # In Emptiness mode, only Ω0 is allowed
-        return omega_level == OmegaLevel.OMEGA_0
+        return omega_level in self.allowed_omegas
 
     def record_blocked_call(self, tool_call: ToolCall) -> None:
         """Record a blocked tool call for later review."""
         if self._state == EmptinessState.EMPTINESS:
             self._blocked_calls.append(tool_call)
+            self._blocked_snapshot = None
 
     def _generate_review_packet(self) -> ReviewPacket:
         """Generate a review packet from blocked calls."""
-        import uuid
         packet = ReviewPacket(
-            packet_id=str(uuid.uuid4()),
-            timestamp=time.time(),
-            blocked_calls=self._blocked_calls.copy(),
+            packet_id=_uuid4().hex,
+            timestamp=_now(),
+            blocked_calls=self.blocked_calls,
             recommendation=f"{len(self._blocked_calls)} action(s) blocked during Emptiness Window",
         )
         self._review_packets.append(packet)
+        self._packets_snapshot = None
         return packet
 
     def get_status(self) -> Dict[str, Any]:
@@ -142,18 +178,32 @@ class EmptinessWindow:
             "activation_reason": self._activation_reason,
             "blocked_calls_count": len(self._blocked_calls),
             "duration_seconds": (
-                time.time() - self._activated_at
+                _now() - self._activated_at
                 if self._activated_at else None
             ),
         }
 
-    def get_blocked_calls(self) -> List[ToolCall]:
-        """Get list of blocked calls during current Emptiness window."""
-        return self._blocked_calls.copy()
+    @property
+    def blocked_calls(self) -> Tuple[ToolCall, ...]:
+        """Calls blocked during the current Emptiness window (immutable snapshot)."""
+        if self._blocked_snapshot is None:
+            self._blocked_snapshot = tuple(self._blocked_calls)
+        return self._blocked_snapshot
+
+    @property
+    def review_packets(self) -> Tuple[ReviewPacket, ...]:
+        """All generated review packets (immutable snapshot)."""
+        if self._packets_snapshot is None:
+            self._packets_snapshot = tuple(self._review_packets)
+        return self._packets_snapshot
+
+    def get_blocked_calls(self) -> Tuple[ToolCall, ...]:
+        """Get blocked calls during current Emptiness window."""
+        return self.blocked_calls
 
-    def get_review_packets(self) -> List[ReviewPacket]:
+    def get_review_packets(self) -> Tuple[ReviewPacket, ...]:
         """Get all generated review packets."""
-        return self._review_packets.copy()
+        return self.review_packets
 
     def add_dry_run_diff(self, diff: Dict[str, Any]) -> None:
         """Add a dry-run diff to current session (for review packet)."""
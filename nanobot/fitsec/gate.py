@@ -7,9 +7,14 @@ Key principle: execution is blocked when the detector/policy
 is not *operationally usable* (not just "accurate").
 """
 from __future__ import annotations
-from typing import Optional
+from dataclasses import replace
+from typing import Dict, Optional, Tuple
 
-from .types import GateMetrics, GateStatus
+from .types import GateCheckResult, GateMetrics, GateStatus
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "%.3f" % value if value is not None else "N/A"
 
 
 class MonitorabilityGate:
@@ -23,6 +28,21 @@ class MonitorabilityGate:
     4. Lead time stability - alerts come early enough consistently
     """
 
+    # status -> (template, measured metric attribute, threshold attribute);
+    # a None metric attribute means the value comes from GateCheckResult.cv
+    _FAILURE_REASONS: Dict[GateStatus, Tuple[str, Optional[str], str]] = {
+        GateStatus.FAIL_FPR: ("FPR (%s) exceeds target (%s)", "fpr", "fpr_target"),
+        GateStatus.FAIL_COVERAGE: (
+            "Coverage (%s) below target (%s)", "coverage_at_fpr", "coverage_target"
+        ),
+        GateStatus.FAIL_CALIBRATION: (
+            "Calibration (%s) below threshold (%s)", "calibration_score", "calibration_threshold"
+        ),
+        GateStatus.FAIL_LEAD_TIME: (
+            "Lead time coefficient of variation (%s) exceeds max (%s)", None, "lead_time_cv_max"
+        ),
+    }
+
     def __init__(
         self,
         fpr_target: float = 0.05,
@@ -37,10 +57,19 @@ class MonitorabilityGate:
 
         # Current metrics (can be updated by external metric providers)
         self._metrics: Optional[GateMetrics] = None
+        self.version = 0  # bumped by update_metrics()
 
-    def update_metrics(self, metrics: GateMetrics) -> None:
-        """Update gate metrics from external provider."""
-        self._metrics = metrics
+    def update_metrics(self, metrics: Optional[GateMetrics]) -> None:
+        """
+        Update gate metrics from external provider.
+
+        The gate keeps its own copy, so callers caching check() results by
+        `version` can't be bypassed by changing `metrics` in place later;
+        pass it in again to apply such changes. None clears the metrics
+        (check() reports UNKNOWN again).
+        """
+        self._metrics = replace(metrics) if metrics is not None else None
+        self.version += 1
 
     def check(self, metrics: Optional[GateMetrics] = None) -> GateStatus:
         """
@@ -48,68 +77,90 @@ class MonitorabilityGate:
 
         Returns GateStatus indicating pass/fail and reason.
         """
+        return self.check_detailed(metrics).status
+
+    def check_detailed(self, metrics: Optional[GateMetrics] = None) -> GateCheckResult:
+        """
+        Evaluate the monitorability gate, keeping what is needed to explain a failure.
+
+        Pass the result to `format_failure_reason()` instead of re-checking.
+        """
         m = metrics or self._metrics
 
         if m is None:
             # No metrics = unknown state
             # Conservative: we could return UNKNOWN or FAIL
             # For safety, we allow with UNKNOWN (policy layer handles)
-            return GateStatus.UNKNOWN
+            return GateCheckResult(GateStatus.UNKNOWN)
 
         # Check FPR controllability
         if m.fpr is not None and m.fpr > m.fpr_target:
-            return GateStatus.FAIL_FPR
+            return GateCheckResult(GateStatus.FAIL_FPR, m)
 
         # Check coverage at target FPR
         if m.coverage_at_fpr is not None and m.coverage_at_fpr < m.coverage_target:
-            return GateStatus.FAIL_COVERAGE
+            return GateCheckResult(GateStatus.FAIL_COVERAGE, m)
 
         # Check calibration sanity
         if m.calibration_score is not None and m.calibration_score < m.calibration_threshold:
-            return GateStatus.FAIL_CALIBRATION
+            return GateCheckResult(GateStatus.FAIL_CALIBRATION, m)
 
         # Check lead time stability (if applicable)
         if m.lead_time_mean is not None and m.lead_time_std is not None:
             if m.lead_time_mean > 0:
                 cv = m.lead_time_std / m.lead_time_mean
                 if cv > m.lead_time_cv_max:
-                    return GateStatus.FAIL_LEAD_TIME
+                    return GateCheckResult(GateStatus.FAIL_LEAD_TIME, m, cv)
 
-        return GateStatus.PASS
+        return GateCheckResult(GateStatus.PASS, m)
 
     def get_metrics(self) -> Optional[GateMetrics]:
-        """Get current metrics snapshot."""
-        return self._metrics
+        """Get a copy of the current metrics (edit it, then `update_metrics()`)."""
+        return replace(self._metrics) if self._metrics is not None else None
 
     def is_operational(self, metrics: Optional[GateMetrics] = None) -> bool:
         """Simple boolean check for operational usability."""
         status = self.check(metrics)
         return status in (GateStatus.PASS, GateStatus.UNKNOWN)
 
-    def get_failure_reason(self, metrics: Optional[GateMetrics] = None) -> Optional[str]:
-        """Get human-readable failure reason if gate fails."""
+    def get_failure_code(self, metrics: Optional[GateMetrics] = None) -> Optional[GateStatus]:
+        """Get the failing status, or None if the gate is operational. Builds no message."""
         status = self.check(metrics)
-
-        if status == GateStatus.PASS:
+        if status is GateStatus.PASS or status is GateStatus.UNKNOWN:
             return None
-        if status == GateStatus.UNKNOWN:
+        return status
+
+    def get_failure_reason(
+        self,
+        metrics: Optional[GateMetrics] = None,
+        result: Optional[GateCheckResult] = None,
+    ) -> Optional[str]:
+        """Get human-readable failure reason if gate fails (re-checks unless given `result`)."""
+        if result is None:
+            result = self.check_detailed(metrics)
+        return self.format_failure_reason(result)
+
+    def format_failure_reason(self, result: GateCheckResult) -> Optional[str]:
+        """
+        Render the message for a check result; None if it didn't fail.
+
+        Kept separate from checking so the string is only built when a failure
+        is actually reported.
+        """
+        status = result.status
+        if status is GateStatus.PASS or status is GateStatus.UNKNOWN:
             return None
 
-        m = self._metrics
+        m = result.metrics
         if m is None:
-            return f"Gate failed: {status.name} (no metrics)"
-
-        fpr_str = f"{m.fpr:.3f}" if m.fpr is not None else "N/A"
-        cov_str = f"{m.coverage_at_fpr:.3f}" if m.coverage_at_fpr is not None else "N/A"
-        cal_str = f"{m.calibration_score:.3f}" if m.calibration_score is not None else "N/A"
+            return "Gate failed: %s (no metrics)" % status.name
 
-        reasons = {
-            GateStatus.FAIL_FPR: f"FPR ({fpr_str}) exceeds target ({self.fpr_target})",
-            GateStatus.FAIL_COVERAGE: f"Coverage ({cov_str}) below target ({self.coverage_target})",
-            GateStatus.FAIL_CALIBRATION: f"Calibration ({cal_str}) below threshold ({self.calibration_threshold})",
-            GateStatus.FAIL_LEAD_TIME: "Lead time coefficient of variation too high",
-        }
-        return reasons.get(status, f"Gate failed: {status.name}")
+        reason = self._FAILURE_REASONS.get(status)
+        if reason is None:
+            return "Gate failed: %s" % status.name
+        template, value_attr, target_attr = reason
+        value = result.cv if value_attr is None else getattr(m, value_attr)
+        return template % (_fmt(value), getattr(m, target_attr))
 
 
 class EmergencyGate:
@@ -123,16 +174,19 @@ class EmergencyGate:
     def __init__(self):
         self._emergency_active = False
         self._reason: str = ""
+        self.version = 0  # bumped on activate()/deactivate()
 
     def activate(self, reason: str = "Manual emergency activation") -> None:
         """Activate emergency mode."""
         self._emergency_active = True
         self._reason = reason
+        self.version += 1
 
     def deactivate(self) -> None:
         """Deactivate emergency mode."""
         self._emergency_active = False
         self._reason = ""
+        self.version += 1
 
     def is_active(self) -> bool:
         """Check if emergency mode is active."""
@@ -4,9 +4,12 @@ FIT-Sec Policy Engine
 Static policy rules for tool execution authorization.
 """
 from __future__ import annotations
+import heapq
 import json
+import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .types import (
     Decision,
@@ -17,6 +20,15 @@ from .types import (
     ToolManifest,
 )
 
+_now = time.time
+
+
+# Rationale for the default O0 allow; shared with callers that fast-path O0 tools
+OMEGA0_ALLOW_RATIONALE = "O0 (safe) - allowed by default"
+
+# Upper bound on memoized decisions (tool/action pairs are few; this is a backstop)
+DECISION_CACHE_SIZE = 4096
+
 
 class PolicyEngine:
     """
@@ -26,6 +38,12 @@ class PolicyEngine:
     - O0: ALLOW
     - O1: ALLOW if audit enabled
     - O2: DENY unless explicitly granted in approval window
+
+    Decisions are memoized per (tool_id, action, omega, gate_status). Every
+    policy mutation bumps `policy_epoch` and clears the cache, and expired O2
+    approvals are swept (via a min-heap on expiry) before the lookup. Only
+    the decision's fields are cached: every call gets its own PolicyDecision,
+    timestamped when it was evaluated.
     """
 
     def __init__(
@@ -33,9 +51,14 @@ class PolicyEngine:
         policy_path: Optional[Path] = None,
         default_omega2_deny: bool = True,
     ):
-        self.default_omega2_deny = default_omega2_deny
+        self._default_omega2_deny = default_omega2_deny
+        self._policy_epoch = 0
+        # key -> (decision, omega_level, gate_status, rationale)
+        self._decision_cache: Dict[tuple, Tuple[Decision, OmegaLevel, GateStatus, str]] = {}
+        self._export_cache: Optional[Dict[str, Any]] = None
         self._grants: Dict[str, Set[str]] = {}  # tool_id -> allowed actions
         self._omega2_approvals: Dict[str, float] = {}  # tool_id -> expiry timestamp
+        self._approval_expiry_heap: List[Tuple[float, str]] = []  # may hold stale entries
         self._blocked_tools: Set[str] = set()
         self._allowed_network_domains: Set[str] = set()
 
@@ -49,26 +72,50 @@ class PolicyEngine:
 
         # Load grants
         for tool_id, actions in data.get("grants", {}).items():
-            self._grants[tool_id] = set(actions)
+            self._grants[sys.intern(tool_id)] = set(actions)
 
         # Load blocked tools
-        self._blocked_tools = set(data.get("blocked_tools", []))
+        self._blocked_tools = set(map(sys.intern, data.get("blocked_tools", [])))
 
         # Load network allowlist
         self._allowed_network_domains = set(data.get("allowed_network_domains", []))
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Forget memoized decisions after a policy change."""
+        self._policy_epoch += 1
+        self._decision_cache.clear()
+        self._export_cache = None
+
+    @property
+    def policy_epoch(self) -> int:
+        """Counter bumped on every change that can alter a decision."""
+        return self._policy_epoch
+
+    @property
+    def default_omega2_deny(self) -> bool:
+        return self._default_omega2_deny
+
+    @default_omega2_deny.setter
+    def default_omega2_deny(self, value: bool) -> None:
+        self._default_omega2_deny = value
+        self._invalidate()
 
     def evaluate(
         self,
         tool_call: ToolCall,
         manifest: Optional[ToolManifest],
         gate_status: GateStatus = GateStatus.UNKNOWN,
+        timestamp: Optional[float] = None,
     ) -> PolicyDecision:
         """
         Evaluate a tool call against policy.
 
-        Returns PolicyDecision with ALLOW/DENY/REVIEW.
+        Returns PolicyDecision with ALLOW/DENY/REVIEW, stamped with
+        `timestamp` (callers that already read the clock pass it) or now.
         """
-        import time
+        if timestamp is None:
+            timestamp = _now()
 
         # No manifest = unknown tool = deny
         if manifest is None:
@@ -77,10 +124,36 @@ class PolicyEngine:
                 omega_level=OmegaLevel.UNKNOWN,
                 gate_status=gate_status,
                 rationale="Tool not registered (no manifest)",
+                timestamp=timestamp,
             )
 
         omega = manifest.omega_level
 
+        # Expire lapsed O2 approvals first so a cached ALLOW can't outlive them
+        if self._approval_expiry_heap:
+            self._expire_approvals()
+
+        key = (tool_call.tool_id, tool_call.action, omega, gate_status)
+        fields = self._decision_cache.get(key)
+        if fields is not None:
+            return PolicyDecision(*fields, timestamp=timestamp)
+
+        if len(self._decision_cache) >= DECISION_CACHE_SIZE:
+            self._decision_cache.clear()
+        decision = self._decide(tool_call, omega, gate_status)
+        decision.timestamp = timestamp
+        self._decision_cache[key] = (
+            decision.decision, decision.omega_level, decision.gate_status, decision.rationale
+        )
+        return decision
+
+    def _decide(
+        self,
+        tool_call: ToolCall,
+        omega: OmegaLevel,
+        gate_status: GateStatus,
+    ) -> PolicyDecision:
+        """Apply the policy rules to a registered tool (uncached)."""
         # Blocked tool check
         if tool_call.tool_id in self._blocked_tools:
             return PolicyDecision(
@@ -96,7 +169,7 @@ class PolicyEngine:
                 decision=Decision.ALLOW,
                 omega_level=omega,
                 gate_status=gate_status,
-                rationale="O0 (safe) - allowed by default",
+                rationale=OMEGA0_ALLOW_RATIONALE,
             )
 
         # O1: allow if gate passes
@@ -118,18 +191,14 @@ class PolicyEngine:
 
         # O2: deny by default, require explicit approval
         if omega == OmegaLevel.OMEGA_2:
-            # Check for time-bounded approval
+            # Check for time-bounded approval (expired ones were swept in evaluate)
             if tool_call.tool_id in self._omega2_approvals:
-                expiry = self._omega2_approvals[tool_call.tool_id]
-                if time.time() < expiry:
-                    return PolicyDecision(
-                        decision=Decision.ALLOW,
-                        omega_level=omega,
-                        gate_status=gate_status,
-                        rationale="O2 - explicitly approved (time-bounded)",
-                    )
-                else:
-                    del self._omega2_approvals[tool_call.tool_id]
+                return PolicyDecision(
+                    decision=Decision.ALLOW,
+                    omega_level=omega,
+                    gate_status=gate_status,
+                    rationale="O2 - explicitly approved (time-bounded)",
+                )
 
             # Check grant list
             if tool_call.tool_id in self._grants:
@@ -143,7 +212,7 @@ class PolicyEngine:
                     )
 
             # Default deny
-            if self.default_omega2_deny:
+            if self._default_omega2_deny:
                 return PolicyDecision(
                     decision=Decision.DENY,
                     omega_level=omega,
@@ -172,24 +241,49 @@ class PolicyEngine:
         duration_seconds: float = 300.0,  # 5 minute default
     ) -> None:
         """Grant time-bounded approval for an O2 tool."""
-        import time
-        self._omega2_approvals[tool_id] = time.time() + duration_seconds
+        expiry = _now() + duration_seconds
+        tool_id = sys.intern(tool_id)
+        self._omega2_approvals[tool_id] = expiry
+        heapq.heappush(self._approval_expiry_heap, (expiry, tool_id))
+        self._invalidate()
+
+    def _expire_approvals(self) -> None:
+        """Drop every O2 approval whose expiry has passed."""
+        heap = self._approval_expiry_heap
+        now = _now()
+        expired = False
+        while heap and heap[0][0] <= now:
+            expiry, tool_id = heapq.heappop(heap)
+            # Skip entries superseded by a re-grant or revoke
+            if self._omega2_approvals.get(tool_id) == expiry:
+                del self._omega2_approvals[tool_id]
+                expired = True
+        if expired:
+            self._invalidate()
 
     def revoke_omega2_approval(self, tool_id: str) -> None:
         """Revoke O2 approval for a tool."""
         self._omega2_approvals.pop(tool_id, None)
+        self._invalidate()
 
     def block_tool(self, tool_id: str) -> None:
         """Add tool to blocklist."""
-        self._blocked_tools.add(tool_id)
+        self._blocked_tools.add(sys.intern(tool_id))
+        self._invalidate()
 
     def unblock_tool(self, tool_id: str) -> None:
         """Remove tool from blocklist."""
         self._blocked_tools.discard(tool_id)
+        self._invalidate()
+
+    def is_blocked(self, tool_id: str) -> bool:
+        """Check if a tool is on the blocklist."""
+        return tool_id in self._blocked_tools
 
     def add_network_domain(self, domain: str) -> None:
         """Add domain to network egress allowlist."""
         self._allowed_network_domains.add(domain)
+        self._export_cache = None
 
     def check_network_domain(self, domain: str) -> bool:
         """Check if domain is in network allowlist."""
@@ -198,12 +292,17 @@ class PolicyEngine:
         return domain in self._allowed_network_domains
 
     def export_policy(self) -> Dict[str, Any]:
-        """Export current policy state."""
-        return {
-            "grants": {k: list(v) for k, v in self._grants.items()},
-            "blocked_tools": list(self._blocked_tools),
-            "allowed_network_domains": list(self._allowed_network_domains),
-            "omega2_approvals": {
-                k: v for k, v in self._omega2_approvals.items()
-            },
-        }
+        """
+        Export current policy state, cached until the policy next changes.
+
+        The returned dict is shared; don't mutate it (or the lists it holds).
+        """
+        self._expire_approvals()
+        if self._export_cache is None:
+            self._export_cache = {
+                "grants": {k: list(v) for k, v in self._grants.items()},
+                "blocked_tools": list(self._blocked_tools),
+                "allowed_network_domains": list(self._allowed_network_domains),
+                "omega2_approvals": dict(self._omega2_approvals),
+            }
+        return self._export_cache
@@ -19,11 +19,15 @@ Design constraints:
 - Safe failure: if uncertain → block and generate review packet
 """
 from __future__ import annotations
+import sys
+import time
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
 
 from .types import (
     Decision,
+    DecisionResult,
     EmptinessActiveError,
     FitSecError,
     GateFailedError,
@@ -42,12 +46,26 @@ from .audit import AuditLogger
 from .emptiness import EmptinessWindow
 
 
+# Levels that must pass the Monitorability Gate before execution. A tuple:
+# `in` matches members by identity before comparing.
+GATED_OMEGA_LEVELS = (OmegaLevel.OMEGA_1, OmegaLevel.OMEGA_2)
+
+_now = time.time
+
+TOOL_NOT_REGISTERED_RATIONALE = "Tool not registered"
+
+
 class ToolRegistry:
     """Registry of declared tools with their manifests."""
 
     def __init__(self):
         self._tools: Dict[str, ToolManifest] = {}
         self._executors: Dict[str, Callable] = {}
+        # Lookups run on every execute(); bind the dicts' own get() so they
+        # cost no extra Python frame. register() only mutates these dicts.
+        self.get_manifest: Callable[[str], Optional[ToolManifest]] = self._tools.get
+        self.get_executor: Callable[[str], Optional[Callable]] = self._executors.get
+        self.version = 0  # bumped by register(), so callers can cache lookups
 
     def register(
         self,
@@ -55,21 +73,31 @@ class ToolRegistry:
         executor: Optional[Callable] = None,
     ) -> None:
         """Register a tool with its manifest and optional executor."""
-        self._tools[manifest.tool_id] = manifest
+        # Interned keys let lookups with interned names match by identity
+        tool_id = sys.intern(manifest.tool_id)
+        self._tools[tool_id] = manifest
         if executor:
-            self._executors[manifest.tool_id] = executor
+            self._executors[tool_id] = executor
+        self.version += 1
 
-    def get_manifest(self, tool_id: str) -> Optional[ToolManifest]:
-        """Get manifest for a tool."""
-        return self._tools.get(tool_id)
+    def register_many(
+        self,
+        items: Iterable[Tuple[ToolManifest, Optional[Callable]]],
+    ) -> None:
+        """Register several (manifest, executor) pairs at once."""
+        items = list(items)
+        self._tools.update({sys.intern(manifest.tool_id): manifest for manifest, _ in items})
+        self._executors.update(
+            {sys.intern(manifest.tool_id): executor for manifest, executor in items if executor}
+        )
+        self.version += 1
 
-    def get_executor(self, tool_id: str) -> Optional[Callable]:
-        """Get executor function for a tool."""
-        return self._executors.get(tool_id)
+    def list_tools(self) -> Mapping[str, ToolManifest]:
+        """Read-only live view of all registered tools."""
+        return MappingProxyType(self._tools)
 
-    def list_tools(self) -> Dict[str, ToolManifest]:
-        """List all registered tools."""
-        return self._tools.copy()
+    def __len__(self) -> int:
+        return len(self._tools)
 
 
 class FitSecRuntime:
@@ -82,6 +110,20 @@ class FitSecRuntime:
     - Monitorability gate enforcement
     - Emptiness Window support
     - Complete audit logging
+
+    Once an O0 call is allowed, its manifest, executor and decision are kept
+    in a per-tool fast path: O0 calls pass Emptiness, the emergency gate and
+    the monitorability gate unconditionally, so only a policy change or a
+    (re-)registration can change the outcome, and either drops the table.
+
+    For other levels, the outcome of the Emptiness, emergency and
+    monitorability checks is cached per Omega level while none of the three
+    changes (tracked by their `version` counters), so steady-state calls skip
+    straight to policy evaluation.
+
+    `audit_aggregate` is passed to `AuditLogger(aggregate=...)`: e.g.
+    `{(OmegaLevel.OMEGA_0, Decision.ALLOW)}` counts successful O0 calls per
+    window instead of logging each one. Denials and errors are always logged.
     """
 
     def __init__(
@@ -89,6 +131,7 @@ class FitSecRuntime:
         policy_path: Optional[Path] = None,
         audit_path: Optional[Path] = None,
         strict_mode: bool = True,
+        audit_aggregate: Iterable[Tuple[OmegaLevel, Decision]] = (),
     ):
         self.strict_mode = strict_mode
 
@@ -101,8 +144,20 @@ class FitSecRuntime:
         self.audit = AuditLogger(
             log_path=audit_path,
             in_memory=(audit_path is None),
+            aggregate=audit_aggregate,
         )
 
+        # tool_id -> (manifest, executor, decision) for allowed O0 tools,
+        # valid while (policy epoch, registry version) == _fast_path_key
+        self._fast_path: Dict[str, Tuple[ToolManifest, Callable, PolicyDecision]] = {}
+        self._fast_path_key = (-1, -1)
+
+        # omega -> gate status for levels that passed Emptiness, the emergency
+        # gate and the monitorability gate, valid while
+        # (emptiness, emergency gate, gate) versions == _gating_key
+        self._gating: Dict[OmegaLevel, GateStatus] = {}
+        self._gating_key = (-1, -1, -1)
+
     def register_tool(
         self,
         manifest: ToolManifest,
@@ -111,6 +166,13 @@ class FitSecRuntime:
         """Register a tool with manifest and optional executor."""
         self.registry.register(manifest, executor)
 
+    def register_tools(
+        self,
+        items: Iterable[Tuple[ToolManifest, Optional[Callable]]],
+    ) -> None:
+        """Register several (manifest, executor) pairs at once."""
+        self.registry.register_many(items)
+
     def execute(
         self,
         tool_call: ToolCall,
@@ -132,90 +194,73 @@ class FitSecRuntime:
             GateFailedError: Monitorability gate failed
             EmptinessActiveError: Blocked by Emptiness Window
         """
+        outcome = self.execute_checked(tool_call, dry_run)
+        if outcome.error is not None:
+            raise outcome.error
+        return outcome.result
+
+    def execute_checked(
+        self,
+        tool_call: ToolCall,
+        dry_run: bool = False,
+    ) -> DecisionResult:
+        """
+        Like `execute()`, but a refusal is returned as `DecisionResult.error`
+        instead of raised, so callers that handle denials inline skip the
+        raise/catch. Exceptions from the executor itself still propagate.
+
+        The clock is read once: the audit entry and any denial decision are
+        stamped with the time the call entered execute_checked().
+        """
+        now = _now()
+        if (
+            self._fast_path_key[0] != self.policy.policy_epoch
+            or self._fast_path_key[1] != self.registry.version
+        ):
+            self._fast_path.clear()
+            self._fast_path_key = (self.policy.policy_epoch, self.registry.version)
+        elif not dry_run:
+            fast = self._fast_path.get(tool_call.tool_id)
+            if fast is not None and fast[0].omega_level is OmegaLevel.OMEGA_0:
+                manifest, executor, cached = fast
+                # A fresh decision per call, so each audit record has its own time
+                decision = PolicyDecision(
+                    cached.decision, cached.omega_level, cached.gate_status,
+                    cached.rationale, timestamp=now,
+                )
+                return DecisionResult(
+                    True, self._run_executor(tool_call, manifest, executor, decision, now)
+                )
+
         manifest = self.registry.get_manifest(tool_call.tool_id)
 
         # Step 1: Check manifest exists
         if manifest is None:
-            decision = PolicyDecision(
-                decision=Decision.DENY,
-                omega_level=OmegaLevel.UNKNOWN,
-                gate_status=GateStatus.UNKNOWN,
-                rationale="Tool not registered",
-            )
-            self.audit.log(
-                tool_call=tool_call,
-                manifest=None,
-                policy_decision=decision,
-                executed=False,
-                error="ToolNotRegisteredError",
+            return self._deny(
+                tool_call, None, now, OmegaLevel.UNKNOWN, GateStatus.UNKNOWN,
+                TOOL_NOT_REGISTERED_RATIONALE, "ToolNotRegisteredError",
+                ToolNotRegisteredError(f"Tool '{tool_call.tool_id}' not registered"),
             )
-            raise ToolNotRegisteredError(f"Tool '{tool_call.tool_id}' not registered")
 
         omega = manifest.omega_level
 
-        # Step 2: Check Emptiness Window
-        if not self.emptiness.check_allowed(omega):
-            self.emptiness.record_blocked_call(tool_call)
-            decision = PolicyDecision(
-                decision=Decision.DENY,
-                omega_level=omega,
-                gate_status=GateStatus.UNKNOWN,
-                rationale="Blocked by Emptiness Window",
-            )
-            self.audit.log(
-                tool_call=tool_call,
-                manifest=manifest,
-                policy_decision=decision,
-                executed=False,
-                error="EmptinessActiveError",
-            )
-            raise EmptinessActiveError(
-                f"Action blocked: Emptiness Window active (O{omega.value})"
-            )
-
-        # Step 3: Check Emergency Gate
-        if self.emergency_gate.is_active() and omega != OmegaLevel.OMEGA_0:
-            decision = PolicyDecision(
-                decision=Decision.DENY,
-                omega_level=omega,
-                gate_status=GateStatus.UNKNOWN,
-                rationale=f"Emergency gate active: {self.emergency_gate.get_reason()}",
-            )
-            self.audit.log(
-                tool_call=tool_call,
-                manifest=manifest,
-                policy_decision=decision,
-                executed=False,
-                error="EmergencyGateActive",
-            )
-            raise GateFailedError("Emergency gate is active")
-
-        # Step 4: Check Monitorability Gate (for O1/O2)
-        gate_status = GateStatus.PASS
-        if omega in (OmegaLevel.OMEGA_1, OmegaLevel.OMEGA_2):
-            gate_status = self.gate.check()
-            if gate_status not in (GateStatus.PASS, GateStatus.UNKNOWN):
-                if self.strict_mode:
-                    decision = PolicyDecision(
-                        decision=Decision.DENY,
-                        omega_level=omega,
-                        gate_status=gate_status,
-                        rationale=f"Monitorability gate failed: {gate_status.name}",
-                        metrics_snapshot=self.gate.get_metrics(),
-                    )
-                    self.audit.log(
-                        tool_call=tool_call,
-                        manifest=manifest,
-                        policy_decision=decision,
-                        executed=False,
-                        error="GateFailedError",
-                    )
-                    raise GateFailedError(
-                        self.gate.get_failure_reason() or gate_status.name
-                    )
+        gating_key = (self.emptiness.version, self.emergency_gate.version, self.gate.version)
+        if gating_key != self._gating_key:
+            self._gating.clear()
+            self._gating_key = gating_key
+        gate_status = self._gating.get(omega)
+        if gate_status is None:
+            gating = self._check_gating(tool_call, manifest, omega, now)
+            if isinstance(gating, DecisionResult):
+                return gating
+            gate_status = gating
+            # A failing status only gets here outside strict mode; don't cache
+            # it, strict_mode may be switched on
+            if gate_status is GateStatus.PASS or gate_status is GateStatus.UNKNOWN:
+                self._gating[omega] = gate_status
 
         # Step 5: Evaluate Policy
-        decision = self.policy.evaluate(tool_call, manifest, gate_status)
+        decision = self.policy.evaluate(tool_call, manifest, gate_status, timestamp=now)
 
         # Step 6: Handle decision
         if decision.decision == Decision.DENY:
@@ -225,8 +270,9 @@ class FitSecRuntime:
                 policy_decision=decision,
                 executed=False,
                 error="PolicyDeniedError",
+                timestamp=now,
             )
-            raise PolicyDeniedError(decision.rationale)
+            return DecisionResult(False, error=PolicyDeniedError(decision=decision))
 
         if decision.decision == Decision.REVIEW:
             # Generate review packet
@@ -237,8 +283,11 @@ class FitSecRuntime:
                 policy_decision=decision,
                 executed=False,
                 error="RequiresReview",
+                timestamp=now,
             )
-            raise PolicyDeniedError(f"Requires human review: {decision.rationale}")
+            return DecisionResult(False, error=PolicyDeniedError(
+                f"Requires human review: {decision.rationale}", decision=decision
+            ))
 
         # Step 7: Execute (if not dry run)
         if dry_run:
@@ -248,8 +297,9 @@ class FitSecRuntime:
                 policy_decision=decision,
                 executed=False,
                 result="[DRY RUN]",
+                timestamp=now,
             )
-            return {"dry_run": True, "would_execute": True}
+            return DecisionResult(True, {"dry_run": True, "would_execute": True})
 
         executor = self.registry.get_executor(tool_call.tool_id)
         if executor is None:
@@ -259,10 +309,78 @@ class FitSecRuntime:
                 policy_decision=decision,
                 executed=False,
                 error="NoExecutor",
+                timestamp=now,
+            )
+            return DecisionResult(False, error=FitSecError(
+                f"No executor registered for '{tool_call.tool_id}'"
+            ))
+
+        if omega is OmegaLevel.OMEGA_0 and decision.decision is Decision.ALLOW:
+            self._fast_path[tool_call.tool_id] = (manifest, executor, decision)
+        return DecisionResult(
+            True, self._run_executor(tool_call, manifest, executor, decision, now)
+        )
+
+    def _check_gating(
+        self,
+        tool_call: ToolCall,
+        manifest: ToolManifest,
+        omega: OmegaLevel,
+        now: float,
+    ) -> Union[GateStatus, DecisionResult]:
+        """
+        Run the Emptiness, emergency and monitorability checks (steps 2-4).
+
+        Returns the gate status, or the refusal if a check failed.
+        """
+        # Step 2: Check Emptiness Window
+        if omega not in self.emptiness.allowed_omegas:
+            self.emptiness.record_blocked_call(tool_call)
+            return self._deny(
+                tool_call, manifest, now, omega, GateStatus.UNKNOWN,
+                "Blocked by Emptiness Window", "EmptinessActiveError",
+                EmptinessActiveError(
+                    f"Action blocked: Emptiness Window active (O{omega.value})"
+                ),
+            )
+
+        # Step 3: Check Emergency Gate
+        if self.emergency_gate.is_active() and omega is not OmegaLevel.OMEGA_0:
+            return self._deny(
+                tool_call, manifest, now, omega, GateStatus.UNKNOWN,
+                f"Emergency gate active: {self.emergency_gate.get_reason()}",
+                "EmergencyGateActive",
+                GateFailedError("Emergency gate is active"),
             )
-            raise FitSecError(f"No executor registered for '{tool_call.tool_id}'")
 
-        # Execute and log
+        # Step 4: Check Monitorability Gate (for O1/O2)
+        gate_status = GateStatus.PASS
+        if omega in GATED_OMEGA_LEVELS:
+            gate_check = self.gate.check_detailed()
+            gate_status = gate_check.status
+            if gate_status not in (GateStatus.PASS, GateStatus.UNKNOWN):
+                if self.strict_mode:
+                    return self._deny(
+                        tool_call, manifest, now, omega, gate_status,
+                        f"Monitorability gate failed: {gate_status.name}",
+                        "GateFailedError",
+                        GateFailedError(
+                            self.gate.format_failure_reason(gate_check) or gate_status.name
+                        ),
+                        metrics_snapshot=gate_check.metrics,
+                    )
+
+        return gate_status
+
+    def _run_executor(
+        self,
+        tool_call: ToolCall,
+        manifest: ToolManifest,
+        executor: Callable,
+        decision: PolicyDecision,
+        now: float,
+    ) -> Any:
+        """Execute an allowed call and log the outcome."""
         try:
             result = executor(tool_call.action, tool_call.args)
             self.audit.log(
@@ -271,6 +389,7 @@ class FitSecRuntime:
                 policy_decision=decision,
                 executed=True,
                 result=result,
+                timestamp=now,
             )
             return result
         except Exception as e:
@@ -280,9 +399,41 @@ class FitSecRuntime:
                 policy_decision=decision,
                 executed=True,
                 error=str(e),
+                timestamp=now,
             )
             raise
 
+    def _deny(
+        self,
+        tool_call: ToolCall,
+        manifest: Optional[ToolManifest],
+        now: float,
+        omega: OmegaLevel,
+        gate_status: GateStatus,
+        rationale: str,
+        error: str,
+        exc: FitSecError,
+        metrics_snapshot: Optional[GateMetrics] = None,
+    ) -> DecisionResult:
+        """Audit a denial made before policy evaluation and return it as a refusal."""
+        decision = PolicyDecision(
+            decision=Decision.DENY,
+            omega_level=omega,
+            gate_status=gate_status,
+            rationale=rationale,
+            metrics_snapshot=metrics_snapshot,
+            timestamp=now,
+        )
+        self.audit.log(
+            tool_call=tool_call,
+            manifest=manifest,
+            policy_decision=decision,
+            executed=False,
+            error=error,
+            timestamp=now,
+        )
+        return DecisionResult(False, error=exc)
+
     def enter_emptiness(self, reason: str = "Manual") -> None:
         """Enter Emptiness Window mode."""
         self.emptiness.activate(reason)
@@ -305,6 +456,6 @@ class FitSecRuntime:
             "emptiness": self.emptiness.get_status(),
             "emergency_active": self.emergency_gate.is_active(),
             "emergency_reason": self.emergency_gate.get_reason(),
-            "registered_tools": len(self.registry.list_tools()),
+            "registered_tools": len(self.registry),
             "audit_summary": self.audit.get_summary(),
         }
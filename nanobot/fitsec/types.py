@@ -10,7 +10,17 @@ from typing import Any, Dict, List, Optional
 import time
 
 
-class OmegaLevel(Enum):
+class _IdentityHashEnum(Enum):
+    """
+    Enum hashed by identity rather than by Enum.__hash__ (Python code).
+
+    Members are singletons compared by identity, so this agrees with
+    equality; decision-cache keys and audit counters hash in C.
+    """
+    __hash__ = object.__hash__
+
+
+class OmegaLevel(_IdentityHashEnum):
     """Blast radius classification for tool actions.
 
     Ω0: Safe/reversible - pure read, local compute, no network writes
@@ -23,14 +33,14 @@ class OmegaLevel(Enum):
     UNKNOWN = 99  # Unclassified (treated as Ω2)
 
 
-class Decision(Enum):
+class Decision(_IdentityHashEnum):
     """Policy decision outcomes."""
     ALLOW = auto()
     DENY = auto()
     REVIEW = auto()  # Requires human review
 
 
-class GateStatus(Enum):
+class GateStatus(_IdentityHashEnum):
     """Monitorability gate status."""
     PASS = auto()
     FAIL_FPR = auto()         # FPR not controllable
@@ -40,13 +50,13 @@ class GateStatus(Enum):
     UNKNOWN = auto()          # No metrics available
 
 
-class EmptinessState(Enum):
+class EmptinessState(_IdentityHashEnum):
     """Emptiness Window state."""
     NORMAL = auto()      # Full execution power
     EMPTINESS = auto()   # Cognition only, no commit power
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolManifest:
     """Declared capabilities and constraints for a tool."""
     tool_id: str
@@ -57,21 +67,37 @@ class ToolManifest:
     fs_paths: List[str] = field(default_factory=list)  # Allowed FS access
     requires_approval: bool = False
     hash_sha256: Optional[str] = None  # For supply chain verification
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "tool_id": self.tool_id,
-            "omega_level": self.omega_level.name,
-            "description": self.description,
-            "capabilities": self.capabilities,
-            "network_domains": self.network_domains,
-            "fs_paths": self.fs_paths,
-            "requires_approval": self.requires_approval,
-            "hash_sha256": self.hash_sha256,
-        }
-
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Any field assignment invalidates the cached to_dict() result
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
 
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serializable view of the manifest, cached until a field is reassigned.
+
+        The returned dict is shared; don't mutate it (or the lists it holds).
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "tool_id": self.tool_id,
+                "omega_level": self.omega_level.name,
+                "description": self.description,
+                "capabilities": self.capabilities,
+                "network_domains": self.network_domains,
+                "fs_paths": self.fs_paths,
+                "requires_approval": self.requires_approval,
+                "hash_sha256": self.hash_sha256,
+            }
+        return self._dict_cache
+
+
+@dataclass(slots=True)
 class ToolCall:
     """A proposed tool invocation."""
     tool_id: str
@@ -81,7 +107,7 @@ class ToolCall:
     timestamp: float = field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class GateMetrics:
     """Operational usability metrics for the monitorability gate."""
     fpr: Optional[float] = None           # False positive rate
@@ -95,7 +121,15 @@ class GateMetrics:
     lead_time_cv_max: float = 0.5         # Max coefficient of variation
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class GateCheckResult:
+    """Outcome of a monitorability gate check."""
+    status: GateStatus
+    metrics: Optional[GateMetrics] = None  # Metrics the check was run against
+    cv: Optional[float] = None             # Lead-time coefficient of variation, if computed
+
+
+@dataclass(slots=True)
 class PolicyDecision:
     """Result of a policy evaluation."""
     decision: Decision
@@ -115,7 +149,7 @@ class PolicyDecision:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditEntry:
     """Audit log entry for a tool call decision."""
     entry_id: str
@@ -128,6 +162,14 @@ class AuditEntry:
     timestamp: float = field(default_factory=time.time)
 
 
+@dataclass(slots=True)
+class DecisionResult:
+    """Outcome of `FitSecRuntime.execute_checked()`: a result, or the refusal."""
+    ok: bool
+    result: Any = None
+    error: Optional[FitSecError] = None  # set when the call was refused
+
+
 class FitSecError(Exception):
     """Base exception for FIT-Sec runtime errors."""
     pass
@@ -139,8 +181,18 @@ class ToolNotRegisteredError(FitSecError):
 
 
 class PolicyDeniedError(FitSecError):
-    """Action denied by policy."""
-    pass
+    """
+    Action denied by policy.
+
+    `decision` is the denying PolicyDecision when there is one; the message
+    then defaults to its rationale, so raising builds no new string.
+    """
+
+    def __init__(self, message: Optional[str] = None, decision: Optional[PolicyDecision] = None):
+        if message is None:
+            message = decision.rationale if decision is not None else ""
+        super().__init__(message)
+        self.decision = decision
 
 
 class GateFailedError(FitSecError):
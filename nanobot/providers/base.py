@@ -35,6 +35,10 @@ class LLMProvider(ABC):
     while maintaining a consistent interface.
     """
     
+    # Whether replayed assistant tool calls may carry "arguments" as a dict
+    # rather than the OpenAI-style JSON string.
+    accepts_structured_tool_args: bool = False
+    
     def __init__(self, api_key: str | None = None, api_base: str | None = None):
         self.api_key = api_key
         self.api_base = api_base
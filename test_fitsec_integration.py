@@ -69,8 +69,9 @@ class MockToolRegistry:
         return [{"type": "function", "function": {"name": t.name}} for t in self._tools.values()]
 
     async def execute(self, name: str, params: dict) -> str:
-        tool = self._tools.get(name)
-        if not tool:
+        try:
+            tool = self._tools[name]
+        except KeyError:
             return f"Error: Tool '{name}' not found"
         return await tool.execute(**params)
 
@@ -88,19 +89,21 @@ class TestSecureToolRegistry:
         self._omega_mappings: dict[str, OmegaLevel] = {}
 
     def register(self, tool: MockTool, omega_level: OmegaLevel) -> None:
-        self._registry.register(tool)
-        self._omega_mappings[tool.name] = omega_level
-
-        manifest = ToolManifest(
-            tool_id=tool.name,
-            omega_level=omega_level,
-            description=tool.description,
-            requires_approval=(omega_level == OmegaLevel.OMEGA_2),
-        )
-        self._runtime.register_tool(
-            manifest,
-            executor=lambda action, args: f"[sync:{tool.name}]"
-        )
+        self.register_many([(tool, omega_level)])
+
+    def register_many(self, tools: list[tuple[MockTool, OmegaLevel]]) -> None:
+        items = []
+        for tool, omega_level in tools:
+            self._registry.register(tool)
+            self._omega_mappings[tool.name] = omega_level
+            manifest = ToolManifest(
+                tool_id=tool.name,
+                omega_level=omega_level,
+                description=tool.description,
+                requires_approval=(omega_level == OmegaLevel.OMEGA_2),
+            )
+            items.append((manifest, lambda action, args, name=tool.name: f"[sync:{name}]"))
+        self._runtime.register_tools(items)
 
     async def execute(self, name: str, params: dict) -> str:
         """Execute with FIT-Sec checks."""
@@ -109,14 +112,16 @@ class TestSecureToolRegistry:
         # Check policy
         manifest = self._runtime.registry.get_manifest(name)
 
-        # Check Emptiness
-        if self._runtime.emptiness.is_active:
-            if manifest and not self._runtime.emptiness.check_allowed(manifest.omega_level):
-                self._runtime.emptiness.record_blocked_call(call)
-                raise EmptinessActiveError(f"Emptiness blocks {name}")
+        # Check Emptiness (allowed_omegas holds every level when inactive)
+        emptiness = self._runtime.emptiness
+        if manifest and manifest.omega_level not in emptiness.allowed_omegas:
+            emptiness.record_blocked_call(call)
+            raise EmptinessActiveError(f"Emptiness blocks {name}")
 
         # Evaluate policy
-        decision = self._runtime.policy.evaluate(call, manifest, GateStatus.PASS)
+        decision = self._runtime.policy.evaluate(
+            call, manifest, GateStatus.PASS, timestamp=call.timestamp
+        )
 
         # Check policy decision
         if decision.decision == Decision.DENY:
@@ -124,13 +129,14 @@ class TestSecureToolRegistry:
 
         # Execute
         result = await self._registry.execute(name, params)
-        # Log successful execution
-        self._runtime.audit.log(
+        # Log successful execution without blocking the event loop
+        await self._runtime.audit.log_async(
             tool_call=call,
             manifest=manifest,
             policy_decision=decision,
             executed=True,
             result=result,
+            timestamp=call.timestamp,
         )
         return result
 
@@ -148,9 +154,11 @@ async def run_tests():
 
     # Register tools with different Omega levels
     print("\n[1] Registering mock tools...")
-    registry.register(MockTool("read_file", "Read files"), OmegaLevel.OMEGA_0)
-    registry.register(MockTool("write_file", "Write files"), OmegaLevel.OMEGA_1)
-    registry.register(MockTool("exec", "Execute commands"), OmegaLevel.OMEGA_2)
+    registry.register_many([
+        (MockTool("read_file", "Read files"), OmegaLevel.OMEGA_0),
+        (MockTool("write_file", "Write files"), OmegaLevel.OMEGA_1),
+        (MockTool("exec", "Execute commands"), OmegaLevel.OMEGA_2),
+    ])
     print("   [OK] Registered: read_file(O0), write_file(O1), exec(O2)")
 
     # Test O0 - should pass
@@ -0,0 +1,331 @@
+import gc
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from nanobot.fitsec import (
+    AuditLogger,
+    Decision,
+    GateStatus,
+    OmegaLevel,
+    PolicyDecision,
+    ToolCall,
+    ToolManifest,
+)
+
+
+def _log(audit: AuditLogger, text: str) -> None:
+    audit.log(
+        tool_call=ToolCall(tool_id="echo", action="execute", args={"text": text}),
+        manifest=None,
+        policy_decision=PolicyDecision(
+            decision=Decision.ALLOW,
+            omega_level=OmegaLevel.OMEGA_0,
+            gate_status=GateStatus.PASS,
+            rationale="test",
+        ),
+        executed=True,
+    )
+
+
+def _texts(path: Path) -> list[str]:
+    return [
+        json.loads(line)["tool_call"]["args"]["text"]
+        for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+
+
+def test_flush_writes_logged_entries_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path)
+    for i in range(100):
+        _log(audit, str(i))
+
+    audit.flush()
+    assert _texts(path) == [str(i) for i in range(100)]
+    audit.close()
+
+
+def test_close_flushes_and_next_write_reopens(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path)
+    _log(audit, "a")
+    audit.close()
+    assert _texts(path) == ["a"]
+
+    _log(audit, "b")
+    audit.close()
+    assert _texts(path) == ["a", "b"]
+
+
+def test_summary_and_tool_queries_track_logged_entries() -> None:
+    audit = AuditLogger(in_memory=True)
+    for text in ("a", "b", "c"):
+        _log(audit, text)
+
+    summary = audit.get_summary()
+    assert summary["total"] == 3
+    assert summary["allowed"] == 3
+    assert summary["by_omega_level"] == {"OMEGA_0": 3}
+    assert [e.tool_call.args["text"] for e in audit.get_entries(tool_id="echo", limit=2)] == ["b", "c"]
+    assert audit.get_entries(tool_id="other") == []
+
+    audit.clear()
+    assert audit.get_summary() == {"total": 0}
+    assert audit.get_entries(tool_id="echo") == []
+
+
+def test_in_memory_entries_are_bounded() -> None:
+    audit = AuditLogger(in_memory=True, max_in_memory=2)
+    for text in ("a", "b", "c"):
+        _log(audit, text)
+
+    assert [e.tool_call.args["text"] for e in audit.get_entries()] == ["b", "c"]
+    assert [e.tool_call.args["text"] for e in audit.get_entries(tool_id="echo")] == ["b", "c"]
+    assert audit.get_summary()["total"] == 3
+
+
+def test_tool_index_drops_entries_evicted_from_memory() -> None:
+    audit = AuditLogger(in_memory=True, max_in_memory=2)
+    decision = PolicyDecision(
+        decision=Decision.ALLOW,
+        omega_level=OmegaLevel.OMEGA_0,
+        gate_status=GateStatus.PASS,
+        rationale="test",
+    )
+    for tool_id in ("old", "new", "new", "new"):
+        audit.log(ToolCall(tool_id=tool_id, action="execute"), None, decision, executed=True)
+
+    assert audit.get_entries(tool_id="old") == []
+    assert "old" not in audit._by_tool
+    assert audit.get_entries(tool_id="new") == audit.get_entries()
+
+
+def test_export_jsonl_writes_in_memory_entries(tmp_path: Path) -> None:
+    audit = AuditLogger(in_memory=True)
+    for text in ("a", "b"):
+        _log(audit, text)
+
+    path = tmp_path / "export.jsonl"
+    audit.export_jsonl(path)
+    assert _texts(path) == ["a", "b"]
+
+
+def test_single_producer_ring_preserves_order_under_backpressure(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path, max_queue=4, single_producer=True)
+    for i in range(500):
+        _log(audit, str(i))
+
+    audit.flush()
+    assert _texts(path) == [str(i) for i in range(500)]
+    audit.close()
+
+
+def test_per_record_durability_fsyncs_written_batches(tmp_path: Path, monkeypatch) -> None:
+    synced: list[int] = []
+    monkeypatch.setattr("nanobot.fitsec.audit.os.fsync", synced.append)
+
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path, durability="per_record")
+    _log(audit, "a")
+    audit.flush()
+
+    assert _texts(path) == ["a"]
+    assert synced
+    audit.close()
+
+
+def test_small_max_batch_keeps_every_line(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path, max_batch=2)
+    for i in range(50):
+        _log(audit, str(i))
+
+    audit.flush()
+    assert _texts(path) == [str(i) for i in range(50)]
+    audit.close()
+
+
+def test_aggregated_calls_are_counted_not_logged(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path, aggregate={(OmegaLevel.OMEGA_0, Decision.ALLOW)})
+    for error in (None, None, None, "boom"):  # errors are never aggregated
+        audit.log(
+            tool_call=ToolCall(tool_id="read", action="execute"),
+            manifest=None,
+            policy_decision=PolicyDecision(
+                decision=Decision.ALLOW,
+                omega_level=OmegaLevel.OMEGA_0,
+                gate_status=GateStatus.PASS,
+                rationale="test",
+            ),
+            executed=True,
+            error=error,
+        )
+
+    audit.flush()
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(line.get("error"), line.get("count")) for line in lines] == [("boom", None), (None, 3)]
+    assert audit.get_summary()["total"] == 4
+    assert len(audit.get_entries()) == 1
+    audit.close()
+
+
+def test_unserializable_args_are_recorded_not_fatal(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path)
+    audit.log(
+        tool_call=ToolCall(tool_id="echo", action="execute", args={"obj": object()}),
+        manifest=None,
+        policy_decision=PolicyDecision(
+            decision=Decision.DENY,
+            omega_level=OmegaLevel.OMEGA_1,
+            gate_status=GateStatus.PASS,
+            rationale="test",
+        ),
+        executed=False,
+    )
+    _log(audit, "after")
+
+    audit.flush()
+    first, second = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert "encode_error" in first
+    assert second["tool_call"]["args"] == {"text": "after"}
+    audit.close()
+
+
+async def test_log_async_waits_for_queue_space(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path, max_queue=2, single_producer=True)
+    decision = PolicyDecision(
+        decision=Decision.ALLOW,
+        omega_level=OmegaLevel.OMEGA_0,
+        gate_status=GateStatus.PASS,
+        rationale="test",
+    )
+    for i in range(50):
+        await audit.log_async(
+            tool_call=ToolCall(tool_id="echo", action="execute", args={"text": str(i)}),
+            manifest=None,
+            policy_decision=decision,
+            executed=True,
+        )
+
+    audit.flush()
+    assert _texts(path) == [str(i) for i in range(50)]
+    assert audit.get_summary()["total"] == 50
+    audit.close()
+
+
+def test_writer_errors_reach_the_caller(tmp_path: Path) -> None:
+    audit = AuditLogger(log_path=tmp_path)  # a directory: open() fails on the writer thread
+    _log(audit, "a")
+
+    with pytest.raises(OSError):
+        audit.flush()
+    with pytest.raises(OSError):
+        _log(audit, "b")
+    with pytest.raises(OSError):
+        audit.close()
+    audit.close()  # reported once
+
+
+def test_open_aggregate_window_is_written_when_logger_is_dropped(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path, aggregate={(OmegaLevel.OMEGA_0, Decision.ALLOW)})
+    for _ in range(5):
+        _log(audit, "a")
+
+    del audit
+    gc.collect()
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(line["tool_id"], line["count"]) for line in lines] == [("echo", 5)]
+
+
+def test_export_matches_live_file_after_writing(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path)
+    audit.log(
+        tool_call=ToolCall(tool_id="read", action="execute"),
+        manifest=None,
+        policy_decision=PolicyDecision(
+            decision=Decision.ALLOW,
+            omega_level=OmegaLevel.OMEGA_0,
+            gate_status=GateStatus.PASS,
+            rationale="test",
+        ),
+        executed=True,
+        result={"content": "x"},
+    )
+    audit.flush()
+
+    export = tmp_path / "export.jsonl"
+    audit.export_jsonl(export)
+    assert json.loads(export.read_text(encoding="utf-8"))["result_type"] == "dict"
+    assert json.loads(path.read_text(encoding="utf-8"))["result_type"] == "dict"
+    assert audit.get_entries()[0].result == {"content": "x"}
+    audit.close()
+
+
+@pytest.mark.skipif(not __debug__, reason="the check is an assert")
+def test_single_producer_rejects_flush_from_another_thread(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    audit = AuditLogger(log_path=path, single_producer=True)
+    _log(audit, "a")
+
+    errors: list[BaseException] = []
+
+    def flush() -> None:
+        try:
+            audit.flush()
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=flush)
+    thread.start()
+    thread.join()
+    assert [type(e) for e in errors] == [AssertionError]
+
+    audit.close()
+    assert _texts(path) == ["a"]
+
+
+def test_msgspec_lines_match_the_dict_path() -> None:
+    pytest.importorskip("msgspec")
+    from nanobot.fitsec.audit import _encode_entry, _encode_record, _entry_to_dict
+
+    audit = AuditLogger(in_memory=True)
+    decision = PolicyDecision(
+        decision=Decision.DENY,
+        omega_level=OmegaLevel.OMEGA_2,
+        gate_status=GateStatus.FAIL_FPR,
+        rationale="blocked: «exec»",
+    )
+    audit.log(
+        tool_call=ToolCall(
+            tool_id="exec",
+            action="execute",
+            args={"cmd": "ls -la ✓", "n": 3, "ratio": 0.1, "nested": [1, None, {"a": True}]},
+        ),
+        manifest=ToolManifest(tool_id="exec", omega_level=OmegaLevel.OMEGA_2, description="shell"),
+        policy_decision=decision,
+        executed=False,
+        error="PolicyDeniedError",
+        timestamp=1700000000.25,
+    )
+    _log(audit, "plain")
+    audit.log(
+        tool_call=ToolCall(tool_id="read", action="execute"),
+        manifest=None,
+        policy_decision=decision,
+        executed=True,
+        result={"content": "x"},
+    )
+
+    entries = audit.get_entries()
+    assert len(entries) == 3
+    for entry in entries:
+        assert _encode_entry(entry) == _encode_record(_entry_to_dict(entry))
@@ -0,0 +1,48 @@
+import json
+
+from nanobot.fitsec import EmptinessWindow, OmegaLevel, ToolCall
+
+
+def test_blocked_calls_snapshot_is_reused_until_changed() -> None:
+    window = EmptinessWindow()
+    window.activate("test")
+    window.record_blocked_call(ToolCall(tool_id="exec", action="execute"))
+
+    snapshot = window.get_blocked_calls()
+    assert [c.tool_id for c in snapshot] == ["exec"]
+    assert window.get_blocked_calls() is snapshot
+
+    window.record_blocked_call(ToolCall(tool_id="write_file", action="execute"))
+    assert [c.tool_id for c in window.get_blocked_calls()] == ["exec", "write_file"]
+    assert len(snapshot) == 1
+
+
+def test_review_packet_freezes_blocked_calls() -> None:
+    window = EmptinessWindow()
+    window.activate("test")
+    window.record_blocked_call(ToolCall(tool_id="exec", action="execute"))
+
+    packet = window.deactivate()
+    assert isinstance(packet.blocked_calls, tuple)
+    assert window.get_review_packets() == (packet,)
+    assert window.get_blocked_calls() == ()
+
+
+def test_check_allowed_per_omega_level() -> None:
+    window = EmptinessWindow()
+    assert all(window.check_allowed(level) for level in OmegaLevel)
+
+    window.activate("test")
+    assert [level for level in OmegaLevel if window.check_allowed(level)] == [OmegaLevel.OMEGA_0]
+
+    window.deactivate(require_review=False)
+    assert window.check_allowed(OmegaLevel.UNKNOWN)
+
+
+def test_review_packet_json_includes_blocked_calls() -> None:
+    window = EmptinessWindow()
+    window.activate("test")
+    window.record_blocked_call(ToolCall(tool_id="exec", action="execute", args={"cmd": "ls"}))
+
+    data = json.loads(window.deactivate().to_json_bytes())
+    assert [(c["tool_id"], c["args"]) for c in data["blocked_calls"]] == [("exec", {"cmd": "ls"})]
@@ -0,0 +1,48 @@
+from nanobot.fitsec import GateMetrics, GateStatus, MonitorabilityGate
+
+
+def test_failure_reason_reuses_check_result() -> None:
+    gate = MonitorabilityGate()
+    gate.update_metrics(GateMetrics(fpr=0.2))
+
+    result = gate.check_detailed()
+    assert result.status == GateStatus.FAIL_FPR
+    assert gate.get_failure_reason(result=result) == "FPR (0.200) exceeds target (0.05)"
+
+
+def test_lead_time_failure_reports_cv() -> None:
+    gate = MonitorabilityGate()
+    metrics = GateMetrics(lead_time_mean=1.0, lead_time_std=0.8)
+
+    assert gate.check(metrics) == GateStatus.FAIL_LEAD_TIME
+    assert gate.get_failure_reason(metrics) == (
+        "Lead time coefficient of variation (0.800) exceeds max (0.5)"
+    )
+
+
+def test_no_failure_reason_without_metrics() -> None:
+    gate = MonitorabilityGate()
+    assert gate.check() == GateStatus.UNKNOWN
+    assert gate.get_failure_reason() is None
+
+
+def test_failure_code_defers_formatting() -> None:
+    gate = MonitorabilityGate()
+    assert gate.get_failure_code() is None
+
+    gate.update_metrics(GateMetrics(coverage_at_fpr=0.5))
+    assert gate.get_failure_code() == GateStatus.FAIL_COVERAGE
+    assert gate.format_failure_reason(gate.check_detailed()) == (
+        "Coverage (0.500) below target (0.8)"
+    )
+
+
+def test_update_metrics_none_clears_metrics() -> None:
+    gate = MonitorabilityGate()
+    gate.update_metrics(GateMetrics(fpr=0.2))
+    version = gate.version
+
+    gate.update_metrics(None)
+    assert gate.version == version + 1
+    assert gate.get_metrics() is None
+    assert gate.check() == GateStatus.UNKNOWN
@@ -0,0 +1,83 @@
+import time
+
+from nanobot.fitsec import Decision, OmegaLevel, PolicyEngine, ToolCall, ToolManifest
+
+
+def _manifest(tool_id: str, omega: OmegaLevel) -> ToolManifest:
+    return ToolManifest(tool_id=tool_id, omega_level=omega, description="")
+
+
+def _call(tool_id: str) -> ToolCall:
+    return ToolCall(tool_id=tool_id, action="execute")
+
+
+def test_cached_decision_is_invalidated_by_blocklist() -> None:
+    policy = PolicyEngine()
+    manifest = _manifest("write", OmegaLevel.OMEGA_1)
+
+    first = policy.evaluate(_call("write"), manifest)
+    assert first.decision == Decision.ALLOW
+    second = policy.evaluate(_call("write"), manifest)
+    assert second.decision == Decision.ALLOW and second.rationale == first.rationale
+
+    policy.block_tool("write")
+    assert policy.evaluate(_call("write"), manifest).decision == Decision.DENY
+
+    policy.unblock_tool("write")
+    assert policy.evaluate(_call("write"), manifest).decision == Decision.ALLOW
+
+
+def test_cached_decisions_are_stamped_per_call(monkeypatch) -> None:
+    policy = PolicyEngine()
+    manifest = _manifest("write", OmegaLevel.OMEGA_1)
+    first = policy.evaluate(_call("write"), manifest)
+
+    monkeypatch.setattr("nanobot.fitsec.policy._now", lambda: first.timestamp + 60)
+    second = policy.evaluate(_call("write"), manifest)
+    assert second is not first
+    assert second.timestamp == first.timestamp + 60
+
+    # Callers that already read the clock pass their reading through
+    assert policy.evaluate(_call("write"), manifest, timestamp=5.0).timestamp == 5.0
+    assert policy.evaluate(_call("other"), manifest, timestamp=6.0).timestamp == 6.0
+
+
+def test_cached_omega2_approval_expires() -> None:
+    policy = PolicyEngine()
+    manifest = _manifest("exec", OmegaLevel.OMEGA_2)
+    assert policy.evaluate(_call("exec"), manifest).decision == Decision.DENY
+
+    policy.grant_omega2_approval("exec", duration_seconds=0.05)
+    assert policy.evaluate(_call("exec"), manifest).decision == Decision.ALLOW
+
+    time.sleep(0.06)
+    assert policy.evaluate(_call("exec"), manifest).decision == Decision.DENY
+
+
+def test_expired_approvals_are_swept_on_any_evaluation() -> None:
+    policy = PolicyEngine()
+    for i in range(10):
+        policy.grant_omega2_approval(f"tool{i}", duration_seconds=0.01)
+    policy.grant_omega2_approval("exec", duration_seconds=300)
+
+    time.sleep(0.02)
+    policy.evaluate(_call("read"), _manifest("read", OmegaLevel.OMEGA_0))
+    assert list(policy.export_policy()["omega2_approvals"]) == ["exec"]
+
+
+def test_export_is_cached_until_policy_changes() -> None:
+    policy = PolicyEngine()
+    first = policy.export_policy()
+    assert policy.export_policy() is first
+
+    policy.block_tool("exec")
+    assert policy.export_policy()["blocked_tools"] == ["exec"]
+
+    policy.add_network_domain("example.com")
+    assert policy.export_policy()["allowed_network_domains"] == ["example.com"]
+
+
+def test_enums_of_different_types_are_distinct() -> None:
+    assert OmegaLevel.OMEGA_1 != Decision.ALLOW
+    assert len({OmegaLevel.OMEGA_1, Decision.ALLOW}) == 2
+    assert str(Decision.DENY) == "Decision.DENY"
@@ -0,0 +1,129 @@
+import pytest
+
+from nanobot.fitsec import (
+    EmptinessActiveError,
+    GateFailedError,
+    GateMetrics,
+    GateStatus,
+    OmegaLevel,
+    PolicyDeniedError,
+    ToolCall,
+    ToolManifest,
+    ToolNotRegisteredError,
+)
+from nanobot.fitsec.runtime import FitSecRuntime
+
+
+def test_o0_fast_path_respects_policy_changes() -> None:
+    runtime = FitSecRuntime()
+    calls: list[str] = []
+    runtime.register_tool(
+        ToolManifest(tool_id="read", omega_level=OmegaLevel.OMEGA_0, description="read"),
+        executor=lambda action, args: calls.append(action) or "ok",
+    )
+
+    assert runtime.execute(ToolCall(tool_id="read", action="a")) == "ok"
+    assert "read" in runtime._fast_path
+    assert runtime.execute(ToolCall(tool_id="read", action="b")) == "ok"
+
+    runtime.policy.block_tool("read")
+    with pytest.raises(PolicyDeniedError):
+        runtime.execute(ToolCall(tool_id="read", action="c"))
+
+    assert calls == ["a", "b"]
+    assert runtime.audit.get_summary()["total"] == 3
+
+
+def test_reregistering_drops_the_fast_path() -> None:
+    runtime = FitSecRuntime()
+    manifest = ToolManifest(tool_id="read", omega_level=OmegaLevel.OMEGA_0, description="read")
+    runtime.register_tool(manifest, executor=lambda action, args: "old")
+    assert runtime.execute(ToolCall(tool_id="read", action="a")) == "old"
+
+    runtime.register_tool(manifest, executor=lambda action, args: "new")
+    assert runtime.execute(ToolCall(tool_id="read", action="a")) == "new"
+
+
+def test_policy_denial_carries_the_decision() -> None:
+    runtime = FitSecRuntime()
+    runtime.register_tool(
+        ToolManifest(tool_id="exec", omega_level=OmegaLevel.OMEGA_2, description="exec"),
+        executor=lambda action, args: "ran",
+    )
+
+    with pytest.raises(PolicyDeniedError) as exc_info:
+        runtime.execute(ToolCall(tool_id="exec", action="run"))
+
+    decision = exc_info.value.decision
+    assert decision is not None
+    assert str(exc_info.value) == decision.rationale
+
+
+def test_register_tools_registers_every_pair() -> None:
+    runtime = FitSecRuntime()
+    runtime.register_tools([
+        (ToolManifest(tool_id="a", omega_level=OmegaLevel.OMEGA_0, description="a"),
+         lambda action, args: "a"),
+        (ToolManifest(tool_id="b", omega_level=OmegaLevel.OMEGA_0, description="b"), None),
+    ])
+
+    assert len(runtime.registry) == 2
+    assert runtime.execute(ToolCall(tool_id="a", action="x")) == "a"
+    assert runtime.registry.get_executor("b") is None
+
+
+def test_gating_cache_follows_emptiness_and_gate_changes() -> None:
+    runtime = FitSecRuntime()
+    runtime.register_tool(
+        ToolManifest(tool_id="write", omega_level=OmegaLevel.OMEGA_1, description="write"),
+        executor=lambda action, args: "ok",
+    )
+    assert runtime.execute(ToolCall(tool_id="write", action="a")) == "ok"
+
+    runtime.enter_emptiness("test")
+    with pytest.raises(EmptinessActiveError):
+        runtime.execute(ToolCall(tool_id="write", action="a"))
+    runtime.exit_emptiness()
+
+    runtime.gate.update_metrics(GateMetrics(fpr=0.5))
+    with pytest.raises(GateFailedError):
+        runtime.execute(ToolCall(tool_id="write", action="a"))
+
+    runtime.gate.update_metrics(GateMetrics(fpr=0.01))
+    assert runtime.execute(ToolCall(tool_id="write", action="a")) == "ok"
+
+
+def test_metrics_edited_in_place_cannot_bypass_cached_gating() -> None:
+    runtime = FitSecRuntime()
+    runtime.register_tool(
+        ToolManifest(tool_id="write", omega_level=OmegaLevel.OMEGA_1, description="write"),
+        executor=lambda action, args: "ok",
+    )
+    metrics = GateMetrics(fpr=0.01)
+    runtime.gate.update_metrics(metrics)
+    assert runtime.execute(ToolCall(tool_id="write", action="a")) == "ok"
+
+    # The gate holds copies: in-place edits don't change it until re-applied
+    metrics.fpr = 0.9
+    runtime.gate.get_metrics().fpr = 0.9
+    assert runtime.gate.check() == GateStatus.PASS
+
+    runtime.gate.update_metrics(metrics)
+    assert runtime.gate.check() == GateStatus.FAIL_FPR
+    with pytest.raises(GateFailedError):
+        runtime.execute(ToolCall(tool_id="write", action="a"))
+
+
+def test_execute_checked_returns_refusals() -> None:
+    runtime = FitSecRuntime()
+    runtime.register_tool(
+        ToolManifest(tool_id="read", omega_level=OmegaLevel.OMEGA_0, description="read"),
+        executor=lambda action, args: "ok",
+    )
+
+    allowed = runtime.execute_checked(ToolCall(tool_id="read", action="a"))
+    assert allowed.ok and allowed.result == "ok" and allowed.error is None
+
+    refused = runtime.execute_checked(ToolCall(tool_id="missing", action="a"))
+    assert not refused.ok
+    assert isinstance(refused.error, ToolNotRegisteredError)
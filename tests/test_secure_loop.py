@@ -0,0 +1,41 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+from nanobot.agent.secure_loop import SecureAgentLoop
+from nanobot.bus.events import InboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.providers.base import LLMProvider, LLMResponse
+
+
+class IdleProvider(LLMProvider):
+    async def chat(self, *args: Any, **kwargs: Any) -> LLMResponse:
+        raise AssertionError("not called")
+
+    def get_default_model(self) -> str:
+        return "test-model"
+
+
+async def test_stop_waits_for_in_flight_messages_and_drops_session_locks(tmp_path: Path) -> None:
+    bus = MessageBus()
+    agent = SecureAgentLoop(bus=bus, provider=IdleProvider(), workspace=tmp_path)
+    processed: list[str] = []
+
+    async def process(msg: InboundMessage) -> None:
+        await asyncio.sleep(0.01)
+        processed.append(msg.content)
+
+    agent._process_message = process
+    for i in range(6):
+        await bus.publish_inbound(
+            InboundMessage(channel="cli", sender_id="u", chat_id=f"chat{i % 3}", content=str(i))
+        )
+
+    runner = asyncio.create_task(agent.run())
+    while bus.inbound_size:
+        await asyncio.sleep(0)
+    agent.stop()
+    await runner
+
+    assert sorted(processed) == [str(i) for i in range(6)]
+    assert agent._session_locks == {} and agent._session_users == {}
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nanobot.agent.tools.base import Tool
+from nanobot.agent.tools.secure_registry import SecureToolRegistry
+from nanobot.fitsec import AuditLogger, OmegaLevel, PolicyDeniedError
+from nanobot.fitsec import audit as audit_module
+
+
+class EchoTool(Tool):
+    def __init__(self, name: str = "echo"):
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "echo tool"
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    async def execute(self, **kwargs: Any) -> str:
+        return kwargs.get("text", "")
+
+
+def _audit_lines(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+async def _wait_drained(reg: SecureToolRegistry) -> None:
+    """Wait until the drain task has taken every queued audit record."""
+    async def drained() -> None:
+        while reg._audit_buffer:
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(drained(), timeout=10)
+
+
+async def test_audit_records_are_batched_and_flushed(tmp_path: Path) -> None:
+    audit_path = tmp_path / "audit.jsonl"
+    reg = SecureToolRegistry(audit_path=audit_path)
+    reg.register(EchoTool("read_echo"), omega_level=OmegaLevel.OMEGA_0)
+
+    for i in range(3):
+        assert await reg.execute("read_echo", {"text": str(i)}) == str(i)
+
+    # Nothing hits the file until the batch is flushed
+    assert _audit_lines(audit_path) == []
+
+    reg.flush_audit()
+    lines = _audit_lines(audit_path)
+    assert [line["tool_call"]["args"]["text"] for line in lines] == ["0", "1", "2"]
+
+
+async def test_flush_audit_includes_batch_waiting_for_queue_space(
+    tmp_path: Path, monkeypatch
+) -> None:
+    audit_path = tmp_path / "audit.jsonl"
+    reg = SecureToolRegistry()
+    audit = reg.runtime.audit = AuditLogger(log_path=audit_path, max_queue=1)
+    reg.register(EchoTool("read_echo"), omega_level=OmegaLevel.OMEGA_0)
+
+    # Hold the writer thread on its first entry so the queue fills up
+    release = threading.Event()
+    encode = audit_module._encode_entry_safely
+
+    def held_encode(entry):
+        release.wait(10)
+        return encode(entry)
+
+    monkeypatch.setattr(audit_module, "_encode_entry_safely", held_encode)
+
+    async def until(condition) -> None:
+        async def poll() -> None:
+            while not condition():
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(poll(), timeout=10)
+
+    await reg.execute("read_echo", {"text": "0"})  # taken by the (held) writer
+    await until(lambda: audit._writer is not None and audit._writer._queue.empty())
+    await reg.execute("read_echo", {"text": "1"})  # fills the queue
+    await _wait_drained(reg)
+    await reg.execute("read_echo", {"text": "2"})  # drain task waits for space
+    await until(lambda: audit._waiting)
+    await reg.execute("read_echo", {"text": "3"})  # still in the registry buffer
+
+    threading.Timer(0.2, release.set).start()
+    reg.flush_audit()
+    lines = _audit_lines(audit_path)
+    assert [line["tool_call"]["args"]["text"] for line in lines] == ["0", "1", "2", "3"]
+    audit.close()
+
+
+async def test_audit_drain_task_flushes_in_background(tmp_path: Path) -> None:
+    audit_path = tmp_path / "audit.jsonl"
+    reg = SecureToolRegistry(audit_path=audit_path)
+    reg.register(EchoTool("exec_echo"), omega_level=OmegaLevel.OMEGA_2)
+
+    try:
+        await reg.execute("exec_echo", {"text": "x"})
+    except PolicyDeniedError:
+        pass
+
+    # Wait for the drain task to hand the record off, then for the writer
+    await _wait_drained(reg)
+    reg.runtime.audit.flush()
+    lines = _audit_lines(audit_path)
+    assert len(lines) == 1
+    assert lines[0]["decision"]["decision"] == "DENY"
+
+
+async def test_audit_drain_failure_is_raised_on_next_call(tmp_path: Path) -> None:
+    reg = SecureToolRegistry(audit_path=tmp_path)  # a directory: the writer can't open it
+    reg.register(EchoTool("read_echo"), omega_level=OmegaLevel.OMEGA_0)
+
+    # The first hand-off starts the writer thread, which then dies on open()
+    await reg.execute("read_echo", {"text": "a"})
+    await _wait_drained(reg)
+    reg.runtime.audit._writer._thread.join(timeout=10)
+
+    # The next hand-off fails in the drain task, which keeps the error
+    await reg.execute("read_echo", {"text": "b"})
+    await asyncio.wait_for(reg._audit_task, timeout=10)
+
+    with pytest.raises(OSError):
+        await reg.execute("read_echo", {"text": "c"})
+    # The call's own record is still queued, and not as a tool error
+    assert [r["tool_call"].args["text"] for r in reg._audit_buffer] == ["c"]
+    assert "error" not in reg._audit_buffer[0]
+    # close() reports the writer's error once; the exit finalizer then stays quiet
+    with pytest.raises(OSError):
+        reg.runtime.audit.close()
+
+
+async def test_omega0_fast_path_respects_blocklist() -> None:
+    reg = SecureToolRegistry()
+    reg.register(EchoTool("read_echo"), omega_level=OmegaLevel.OMEGA_0)
+
+    assert await reg.execute("read_echo", {"text": "ok"}) == "ok"
+
+    reg.runtime.policy.block_tool("read_echo")
+    try:
+        await reg.execute("read_echo", {"text": "ok"})
+    except PolicyDeniedError as e:
+        assert "blocked" in str(e)
+    else:
+        raise AssertionError("blocklisted O0 tool was executed")
+
+
+def test_explicit_omega0_override_is_kept(tmp_path: Path) -> None:
+    reg = SecureToolRegistry(audit_path=tmp_path / "audit.jsonl")
+    reg.register(EchoTool("exec"), omega_level=OmegaLevel.OMEGA_0)
+    assert reg.get_omega_level("exec") is OmegaLevel.OMEGA_0